@@ -37,22 +37,26 @@ QUERIES = [
 ]
 
 
-def bench(fn, n: int) -> tuple[float, float, list[float]]:
-    """Run fn() n times. Return (cold, warm_avg, all_times)."""
-    times: list[float] = []
+def bench(fn, n: int) -> tuple[int, float, list[int]]:
+    """Run fn() n times. Return (cold, warm_avg, all_times) in nanoseconds.
+
+    Timings are taken with perf_counter_ns and kept as integer nanoseconds;
+    they are converted to milliseconds only when printed.
+    """
+    times_ns: list[int] = []
     for _ in range(n):
-        t = time.perf_counter()
+        t = time.perf_counter_ns()
         fn()
-        times.append(time.perf_counter() - t)
+        times_ns.append(time.perf_counter_ns() - t)
 
-    cold = times[0]
-    warm_times = times[1:]
-    warm_avg = sum(warm_times) / len(warm_times) if warm_times else cold
-    return cold, warm_avg, times
+    cold_ns = times_ns[0]
+    warm_ns = times_ns[1:]
+    warm_avg_ns = sum(warm_ns) / len(warm_ns) if warm_ns else cold_ns
+    return cold_ns, warm_avg_ns, times_ns
 
 
-def fmt_ms(seconds: float) -> str:
-    return f"{seconds * 1000:8.1f}ms"
+def fmt_ms(nanoseconds: float) -> str:
+    return f"{nanoseconds / 1e6:8.1f}ms"
 
 
 def main() -> int:
@@ -78,10 +82,10 @@ def main() -> int:
     ts = StackOneToolSet(
         api_key=api_key,
         account_id=account_id,
-        search={"method": "auto", "top_k": 5},
+        search={"method": "auto", "top_k": 5, "cache_size": 128},
     )
 
-    results: list[tuple[str, float, float, float]] = []
+    results: list[tuple[str, int, float, float]] = []
     query_idx = 0
 
     def next_query() -> str:
@@ -115,6 +119,10 @@ def main() -> int:
     speedup = cold / warm_avg if warm_avg > 0 else float("inf")
     results.append(("search (semantic)", cold, warm_avg, speedup))
     print(f"       cold={fmt_ms(cold)}  warm_avg={fmt_ms(warm_avg)}  speedup={speedup:.0f}x")
+    cache = ts.semantic_client.cache_info()
+    lookups = cache.hits + cache.misses
+    hit_rate = cache.hits / lookups if lookups else 0.0
+    print(f"       semantic cache: {cache.hits}/{lookups} hits ({hit_rate:.0%})")
 
     # --- Summary ---
     print("\n" + "=" * 65)
@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+import concurrent.futures
 import json
 
 from pydantic import BaseModel, Field, field_validator
@@ -73,6 +74,7 @@ class FeedbackTool(StackOneTool):
         Execute the feedback tool with enhanced validation.
 
         If multiple account IDs are provided, sends the same feedback to each account individually.
+        The per-account requests are issued concurrently; results keep the input order.
 
         Args:
             arguments: Tool arguments as string or dict
@@ -108,30 +110,33 @@ class FeedbackTool(StackOneTool):
                 }
                 return super().execute(validated_arguments, options=options)
 
-            # Multiple account IDs - send to each individually
-            results = []
-            errors = []
+            # Multiple account IDs - send to each individually, in parallel
+            send = super().execute
 
-            for account_id in account_ids:
+            def _send_one(account_id: str) -> JsonDict:
                 try:
                     validated_arguments = {
                         "feedback": feedback,
                         "account_id": account_id,
                         "tool_names": tool_names,
                     }
-                    result = super().execute(validated_arguments, options=options)
-                    results.append({"account_id": account_id, "status": "success", "result": result})
+                    result = send(validated_arguments, options=options)
+                    return {"account_id": account_id, "status": "success", "result": result}
                 except Exception as exc:
-                    error_msg = str(exc)
-                    errors.append({"account_id": account_id, "status": "error", "error": error_msg})
-                    results.append({"account_id": account_id, "status": "error", "error": error_msg})
+                    return {"account_id": account_id, "status": "error", "error": str(exc)}
+
+            max_workers = min(len(account_ids), 10)
+            with concurrent.futures.ThreadPoolExecutor(max_workers=max_workers) as pool:
+                results = list(pool.map(_send_one, account_ids))
+
+            successful = sum(1 for r in results if r["status"] == "success")
 
             # Return combined results
             return {
                 "message": f"Feedback sent to {len(account_ids)} account(s)",
                 "total_accounts": len(account_ids),
-                "successful": len([r for r in results if r["status"] == "success"]),
-                "failed": len(errors),
+                "successful": successful,
+                "failed": len(results) - successful,
                 "results": results,
             }
 
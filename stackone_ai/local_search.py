@@ -82,7 +82,7 @@ class ToolIndex:
         self.bm25_retriever = bm25s.BM25()
         if corpus:
             corpus_tokens = bm25s.tokenize(corpus, stemmer=None, show_progress=False)  # ty: ignore[invalid-argument-type]
-            self.bm25_retriever.index(corpus_tokens)
+            self.bm25_retriever.index(corpus_tokens, show_progress=False)
 
         # Create TF-IDF index
         self.tfidf_index = TfidfIndex()
@@ -111,7 +111,7 @@ class ToolIndex:
 
         # Search with BM25
         bm25_results, bm25_scores = self.bm25_retriever.retrieve(
-            query_tokens, k=min(fetch_limit, len(self.tools))
+            query_tokens, k=min(fetch_limit, len(self.tools)), show_progress=False
         )
 
         # Search with TF-IDF
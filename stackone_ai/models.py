@@ -3,9 +3,12 @@ from __future__ import annotations
 import base64
 import json
 import logging
+import os
+import threading
+from collections import OrderedDict
 from collections.abc import Sequence
-from datetime import datetime, timezone
 from enum import Enum
+from http.cookiejar import CookieJar, DefaultCookiePolicy
 from typing import TYPE_CHECKING, Annotated, Any, ClassVar, TypeAlias, cast
 from urllib.parse import quote
 
@@ -23,6 +26,61 @@ Headers: TypeAlias = dict[str, str]
 
 logger = logging.getLogger("stackone.tools")
 
+_http_client: httpx.Client | None = None
+_http_client_lock = threading.Lock()
+
+
+def _get_http_client() -> httpx.Client:
+    """Return the process-wide HTTP client used for tool execution.
+
+    Sharing one client keeps connections to the StackOne API alive between tool
+    calls instead of opening a new TCP/TLS connection per request. The client never
+    stores cookies: it is shared by every API key and account in the process, so a
+    session cookie set for one caller must not be replayed on another caller's requests.
+    """
+    global _http_client
+    if _http_client is None:
+        with _http_client_lock:
+            if _http_client is None:
+                _http_client = httpx.Client(cookies=CookieJar(policy=DefaultCookiePolicy(allowed_domains=[])))
+    return _http_client
+
+
+def close_http_client() -> None:
+    """Close the shared HTTP client used for tool execution.
+
+    Call this on shutdown to release pooled connections. A new client is created
+    automatically if a tool is executed afterwards.
+    """
+    global _http_client
+    with _http_client_lock:
+        client, _http_client = _http_client, None
+    if client is not None:
+        client.close()
+
+
+def _reset_http_client_after_fork() -> None:
+    """Drop the inherited client in a forked child so it never reuses the parent's sockets.
+
+    The client is discarded rather than closed: closing it would shut down connections
+    that still belong to the parent process.
+    """
+    global _http_client, _http_client_lock
+    _http_client = None
+    _http_client_lock = threading.Lock()
+
+
+if hasattr(os, "register_at_fork"):
+    os.register_at_fork(after_in_child=_reset_http_client_after_fork)
+
+
+# Converted Pydantic AI tools, keyed by the identity of the source tool plus a snapshot of the
+# name, description and schema they were built from. Kept off the model so tools stay picklable
+# and copyable; an entry keeps its source tool alive, so the id in the key cannot be reused.
+_PYDANTIC_AI_TOOL_CACHE_SIZE = 256
+_pydantic_ai_tools: OrderedDict[tuple[int, str, str, str], PydanticAITool] = OrderedDict()
+_pydantic_ai_tools_lock = threading.Lock()
+
 
 class StackOneError(Exception):
     """Base exception for StackOne errors"""
@@ -112,7 +170,7 @@ class StackOneTool(BaseModel):
         Returns:
             Connector name in lowercase
         """
-        return self.name.split("_")[0].lower()
+        return self.name.partition("_")[0].lower()
 
     def __init__(
         self,
@@ -212,7 +270,6 @@ class StackOneTool(BaseModel):
             StackOneAPIError: If the API request fails
             ValueError: If the arguments are invalid
         """
-        datetime.now(timezone.utc)
         feedback_options: JsonDict = {}
         result_payload: JsonDict | None = None
         response_status: int | None = None
@@ -232,7 +289,6 @@ class StackOneTool(BaseModel):
                 raise ValueError(error_message)
 
             kwargs = parsed_arguments
-            dict(kwargs)
 
             headers = self._prepare_headers()
             url_used, body_params, query_params = self._prepare_request_params(kwargs)
@@ -253,7 +309,7 @@ class StackOneTool(BaseModel):
             if query_params:
                 request_kwargs["params"] = query_params
 
-            response = httpx.request(**request_kwargs, timeout=self._execute_config.timeout)
+            response = _get_http_client().request(**request_kwargs, timeout=self._execute_config.timeout)
             response_status = response.status_code
             response.raise_for_status()
 
@@ -282,7 +338,6 @@ class StackOneTool(BaseModel):
             status = "error"
             raise StackOneError(f"Request failed: {exc}") from exc
         finally:
-            datetime.now(timezone.utc)
             metadata: JsonDict = {
                 "http_method": self._execute_config.method,
                 "url": url_used,
@@ -474,6 +529,8 @@ class StackOneTool(BaseModel):
         """Convert this tool to a Pydantic AI ``Tool``.
 
         Requires ``stackone-ai[pydantic-ai]`` (installs ``pydantic-ai-slim``).
+        The converted tool is cached per instance, so repeated calls return the same
+        ``Tool`` until the name, description or parameters change.
 
         Returns:
             A ``pydantic_ai.tools.Tool`` ready to pass to ``Agent(tools=[...])``.
@@ -488,17 +545,29 @@ class StackOneTool(BaseModel):
 
         openai_function = self.to_openai_function()
         json_schema = openai_function["function"]["parameters"]
+        cache_key = (id(self), self.name, self.description, json.dumps(json_schema, sort_keys=True))
+        with _pydantic_ai_tools_lock:
+            cached = _pydantic_ai_tools.get(cache_key)
+            if cached is not None:
+                _pydantic_ai_tools.move_to_end(cache_key)
+                return cached
+
         parent_tool = self
 
         def implementation(**kwargs: Any) -> Any:
             return parent_tool.execute(kwargs)
 
-        return Tool.from_schema(
+        pydantic_ai_tool = Tool.from_schema(
             function=implementation,
             name=self.name,
             description=self.description,
             json_schema=json_schema,
         )
+        with _pydantic_ai_tools_lock:
+            _pydantic_ai_tools[cache_key] = pydantic_ai_tool
+            while len(_pydantic_ai_tools) > _PYDANTIC_AI_TOOL_CACHE_SIZE:
+                _pydantic_ai_tools.popitem(last=False)
+        return pydantic_ai_tool
 
     def set_account_id(self, account_id: str | None) -> None:
         """Set the account ID for this tool
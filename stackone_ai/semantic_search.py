@@ -50,7 +50,10 @@ back. Designed for agent loops where the LLM decides what to search for.
 from __future__ import annotations
 
 import base64
-from typing import Any
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, NamedTuple
 
 import httpx
 from pydantic import BaseModel
@@ -81,6 +84,15 @@ class SemanticSearchResponse(BaseModel):
     project_filter: str | None = None
 
 
+class SemanticSearchCacheInfo(NamedTuple):
+    """Response cache statistics, mirroring ``functools.lru_cache``'s ``cache_info()``."""
+
+    hits: int
+    misses: int
+    maxsize: int
+    currsize: int
+
+
 class SemanticSearchClient:
     """Client for StackOne semantic search API.
 
@@ -99,6 +111,9 @@ class SemanticSearchClient:
         api_key: str,
         base_url: str = DEFAULT_BASE_URL,
         timeout: float = 30.0,
+        cache_size: int = 0,
+        cache_ttl: float | None = 300.0,
+        http_client: httpx.Client | None = None,
     ) -> None:
         """Initialize the semantic search client.
 
@@ -106,15 +121,77 @@ class SemanticSearchClient:
             api_key: StackOne API key
             base_url: Base URL for API requests
             timeout: Request timeout in seconds
+            cache_size: Maximum number of responses kept in the in-memory LRU cache.
+                Defaults to 0, which disables caching.
+            cache_ttl: Seconds a cached response stays valid. ``None`` keeps entries until
+                they are evicted or ``clear_cache()`` is called.
+            http_client: Optional preconfigured ``httpx.Client`` to send requests with
+                (e.g. custom transport or proxies). A pooled client is created lazily if omitted.
         """
         self.api_key = api_key
+        self._auth_header = f"Basic {base64.b64encode(f'{api_key}:'.encode()).decode()}"
+        self._headers = {"Authorization": self._auth_header, "Content-Type": "application/json"}
         self.base_url = base_url.rstrip("/")
         self.timeout = timeout
+        self.cache_size = cache_size
+        self.cache_ttl = cache_ttl
+        # Maps request key -> (monotonic expiry or None, response)
+        self._cache: OrderedDict[tuple[Any, ...], tuple[float | None, SemanticSearchResponse]] = OrderedDict()
+        self._cache_lock = threading.RLock()
+        self._cache_hits = 0
+        self._cache_misses = 0
+        self._client: httpx.Client | None = http_client
+        self._owns_client = http_client is None
+        self._client_lock = threading.Lock()
+
+    def _get_client(self) -> httpx.Client:
+        """Return the pooled HTTP client, creating it on first use.
+
+        Reusing one client keeps connections alive across searches instead of
+        paying a fresh TCP/TLS handshake per request.
+        """
+        if self._client is None:
+            with self._client_lock:
+                if self._client is None:
+                    self._client = httpx.Client(timeout=self.timeout)
+        return self._client
+
+    def close(self) -> None:
+        """Close the pooled HTTP client if this instance created it.
+
+        A caller-supplied ``http_client`` is left open for its owner to close.
+        """
+        with self._client_lock:
+            if self._owns_client and self._client is not None:
+                self._client.close()
+                self._client = None
+
+    def __enter__(self) -> SemanticSearchClient:
+        return self
+
+    def __exit__(self, *exc_info: object) -> None:
+        self.close()
+
+    def clear_cache(self) -> None:
+        """Drop all cached search responses and reset the hit/miss counters."""
+        with self._cache_lock:
+            self._cache.clear()
+            self._cache_hits = 0
+            self._cache_misses = 0
+
+    def cache_info(self) -> SemanticSearchCacheInfo:
+        """Return hit/miss statistics for the response cache."""
+        with self._cache_lock:
+            return SemanticSearchCacheInfo(
+                hits=self._cache_hits,
+                misses=self._cache_misses,
+                maxsize=self.cache_size,
+                currsize=len(self._cache),
+            )
 
     def _build_auth_header(self) -> str:
-        """Build the Basic auth header."""
-        token = base64.b64encode(f"{self.api_key}:".encode()).decode()
-        return f"Basic {token}"
+        """Return the Basic auth header, encoded once at construction."""
+        return self._auth_header
 
     def search(
         self,
@@ -136,7 +213,10 @@ class SemanticSearchClient:
                 the server uses its default (currently 0.4).
 
         Returns:
-            SemanticSearchResponse containing matching actions with similarity scores
+            SemanticSearchResponse containing matching actions with similarity scores.
+            When ``cache_size`` is set, identical requests are served from an in-memory
+            LRU cache for up to ``cache_ttl`` seconds. Each call gets its own copy, so mutating a response
+            never affects later results.
 
         Raises:
             SemanticSearchError: If the API call fails
@@ -146,11 +226,18 @@ class SemanticSearchClient:
             for result in response.results:
                 print(f"{result.action_id}: {result.similarity_score:.2f}")
         """
+        cache_key = (query, connector, top_k, project_id, min_similarity)
+        with self._cache_lock:
+            entry = self._cache.get(cache_key)
+            if entry is not None and (entry[0] is None or entry[0] > time.monotonic()):
+                self._cache.move_to_end(cache_key)
+                self._cache_hits += 1
+                return entry[1].model_copy(deep=True)
+            if entry is not None:
+                del self._cache[cache_key]
+            self._cache_misses += 1
+
         url = f"{self.base_url}/actions/search"
-        headers = {
-            "Authorization": self._build_auth_header(),
-            "Content-Type": "application/json",
-        }
         payload: dict[str, Any] = {"query": query}
         if top_k is not None:
             payload["top_k"] = top_k
@@ -162,17 +249,28 @@ class SemanticSearchClient:
             payload["min_similarity"] = min_similarity
 
         try:
-            response = httpx.post(url, json=payload, headers=headers, timeout=self.timeout)
-            response.raise_for_status()
-            data = response.json()
-            return SemanticSearchResponse(**data)
-        except httpx.HTTPStatusError as e:
-            raise SemanticSearchError(f"API error: {e.response.status_code} - {e.response.text}") from e
+            response = self._get_client().post(url, json=payload, headers=self._headers, timeout=self.timeout)
         except httpx.RequestError as e:
             raise SemanticSearchError(f"Request failed: {e}") from e
         except Exception as e:
             raise SemanticSearchError(f"Search failed: {e}") from e
 
+        if not response.is_success:
+            raise SemanticSearchError(f"API error: {response.status_code} - {response.text}")
+
+        try:
+            result = SemanticSearchResponse.model_validate_json(response.content)
+        except Exception as e:
+            raise SemanticSearchError(f"Search failed: {e}") from e
+
+        if self.cache_size > 0:
+            expires_at = time.monotonic() + self.cache_ttl if self.cache_ttl is not None else None
+            with self._cache_lock:
+                self._cache[cache_key] = (expires_at, result.model_copy(deep=True))
+                if len(self._cache) > self.cache_size:
+                    self._cache.popitem(last=False)
+        return result
+
     def search_action_names(
         self,
         query: str,
@@ -4,11 +4,15 @@ import asyncio
 import base64
 import concurrent.futures
 import fnmatch
+import functools
+import hashlib
+import heapq
 import json
 import logging
 import os
+import re
 import threading
-from collections.abc import Coroutine, Sequence
+from collections.abc import Coroutine, Iterable, Sequence
 from dataclasses import dataclass
 from importlib import metadata
 from typing import TYPE_CHECKING, Any, Literal, TypedDict, TypeVar
@@ -57,6 +61,10 @@ class SearchConfig(TypedDict, total=False):
     """Maximum number of tools to return."""
     min_similarity: float
     """Minimum similarity score threshold 0-1."""
+    cache_size: int
+    """Semantic search responses kept in memory. Defaults to ``0``, which disables the cache."""
+    cache_ttl: float | None
+    """Seconds a cached semantic search response stays valid. ``None`` never expires. Defaults to 300."""
 
 
 class ExecuteToolsConfig(TypedDict, total=False):
@@ -311,7 +319,7 @@ def _create_execute_tool(api_key: str, connectors: str = "") -> _ExecuteTool:
 T = TypeVar("T")
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class _McpToolDefinition:
     name: str
     description: str | None
@@ -363,6 +371,33 @@ def _run_async(awaitable: Coroutine[Any, Any, T]) -> T:
     return result["value"]
 
 
+def _tool_index_fingerprint(tools: Iterable[StackOneTool]) -> str:
+    """Content hash of tool names and descriptions, used to key the local search index."""
+    digest = hashlib.blake2b(digest_size=16)
+    for entry in sorted(f"{tool.name}\0{tool.description}" for tool in tools):
+        digest.update(entry.encode())
+        digest.update(b"\n")
+    return digest.hexdigest()
+
+
+@functools.lru_cache(maxsize=256)
+def _compile_globs(patterns: tuple[str, ...]) -> re.Pattern[str]:
+    """Compile glob patterns into one alternation regex, once per distinct pattern set.
+
+    Each ``fnmatch.translate`` result is self-anchored, so the union matches a name
+    exactly when ``fnmatch.fnmatch`` would match it against any single pattern. An empty
+    pattern set compiles to a regex that matches nothing.
+    """
+    if not patterns:
+        return re.compile(r"(?!)")
+    return re.compile("|".join(fnmatch.translate(os.path.normcase(pattern)) for pattern in patterns))
+
+
+def _provider_set(providers: Iterable[str]) -> frozenset[str]:
+    """Lowercase provider filters once so each tool check is a single set lookup."""
+    return frozenset(provider.lower() for provider in providers)
+
+
 def _build_auth_header(api_key: str) -> str:
     token = base64.b64encode(f"{api_key}:".encode()).decode()
     return f"Basic {token}"
@@ -426,9 +461,9 @@ class _StackOneRpcTool(StackOneTool):
             method="POST",
             url=f"{base_url.rstrip('/')}/actions/rpc",
             name=name,
-            headers={},
             body_type="json",
-            parameter_locations=dict(_RPC_PARAMETER_LOCATIONS),
+            # Validation already copies the mapping into a fresh per-tool dict
+            parameter_locations=_RPC_PARAMETER_LOCATIONS,
             timeout=timeout,
         )
         super().__init__(
@@ -603,7 +638,8 @@ class StackOneToolSet:
         self._timeout: float = timeout if timeout is not None else (execute_timeout or 60.0)
         self._tools_cache: Tools | None = None
         self._catalog_cache: dict[tuple[Any, ...], Tools] = {}
-        self._tool_index_cache: tuple[int, Any] | None = None
+        # (catalog the index was last looked up for, its content fingerprint, built index)
+        self._tool_index_cache: tuple[Tools, str, Any] | None = None
 
     def set_accounts(self, account_ids: list[str]) -> StackOneToolSet:
         """Set account IDs for filtering tools
@@ -619,13 +655,15 @@ class StackOneToolSet:
         return self
 
     def clear_catalog_cache(self) -> None:
-        """Invalidate cached tool catalog and local search index.
+        """Invalidate cached tool catalog, local search index and semantic search responses.
 
         Call when linked accounts change outside of ``set_accounts`` or when
         you need to force a fresh fetch from the StackOne MCP endpoint.
         """
         self._catalog_cache.clear()
         self._tool_index_cache = None
+        if self._semantic_client is not None:
+            self._semantic_client.clear_cache()
 
     def get_search_tool(self, *, search: SearchMode | None = None) -> SearchTool:
         """Get a callable search tool that returns Tools collections.
@@ -835,9 +873,16 @@ class StackOneToolSet:
             SemanticSearchClient instance configured with the toolset's API key and base URL
         """
         if self._semantic_client is None:
+            search_config: SearchConfig = self._search_config or {}
+            cache_options: dict[str, Any] = {}
+            if "cache_size" in search_config:
+                cache_options["cache_size"] = search_config["cache_size"]
+            if "cache_ttl" in search_config:
+                cache_options["cache_ttl"] = search_config["cache_ttl"]
             self._semantic_client = SemanticSearchClient(
                 api_key=self.api_key,
                 base_url=self.base_url,
+                **cache_options,
             )
         return self._semantic_client
 
@@ -857,10 +902,18 @@ class StackOneToolSet:
         if not available_connectors:
             return Tools([])
 
-        cache_key = id(all_tools)
-        if self._tool_index_cache is None or self._tool_index_cache[0] != cache_key:
-            self._tool_index_cache = (cache_key, ToolIndex(list(all_tools)))
-        index = self._tool_index_cache[1]
+        # The same (memoized) catalog object skips fingerprinting; a new object with
+        # identical contents still reuses the index.
+        cached = self._tool_index_cache
+        if cached is not None and cached[0] is all_tools:
+            index = cached[2]
+        else:
+            fingerprint = _tool_index_fingerprint(all_tools)
+            if cached is not None and cached[1] == fingerprint:
+                index = cached[2]
+            else:
+                index = ToolIndex(list(all_tools))
+            self._tool_index_cache = (all_tools, fingerprint, index)
         results = index.search(
             query,
             limit=top_k if top_k is not None else 5,
@@ -872,7 +925,7 @@ class StackOneToolSet:
         matched_tools = [
             tool_map[name]
             for name in matched_names
-            if name in tool_map and name.split("_")[0].lower() in filter_connectors
+            if name in tool_map and name.partition("_")[0].lower() in filter_connectors
         ]
         return Tools(matched_tools[:top_k] if top_k is not None else matched_tools)
 
@@ -988,10 +1041,11 @@ class StackOneToolSet:
             if not all_results and last_error is not None:
                 raise last_error
 
-            # Sort by score, apply top_k
-            all_results.sort(key=lambda r: r.similarity_score, reverse=True)
+            # Rank by score, apply top_k (nlargest keeps sort order and ties without a full sort)
             if effective_top_k is not None:
-                all_results = all_results[:effective_top_k]
+                all_results = heapq.nlargest(effective_top_k, all_results, key=lambda r: r.similarity_score)
+            else:
+                all_results.sort(key=lambda r: r.similarity_score, reverse=True)
 
             if not all_results:
                 return Tools([])
@@ -1146,36 +1200,36 @@ class StackOneToolSet:
             logger.warning("Semantic search failed: %s", e)
             return []
 
-        # Sort by score
+        # Rank by score, apply top_k
+        if effective_top_k is not None:
+            return heapq.nlargest(effective_top_k, all_results, key=lambda r: r.similarity_score)
         all_results.sort(key=lambda r: r.similarity_score, reverse=True)
-        return all_results[:effective_top_k] if effective_top_k is not None else all_results
+        return all_results
 
-    def _filter_by_provider(self, tool_name: str, providers: list[str]) -> bool:
+    def _filter_by_provider(self, tool_name: str, providers: frozenset[str]) -> bool:
         """Check if a tool name matches any of the provider filters
 
         Args:
             tool_name: Name of the tool to check
-            providers: List of provider names (case-insensitive)
+            providers: Lowercased provider names, as built by ``_provider_set``
 
         Returns:
             True if the tool matches any provider, False otherwise
         """
         # Extract provider from tool name (assuming format: provider_action)
-        provider = tool_name.split("_")[0].lower()
-        provider_set = {p.lower() for p in providers}
-        return provider in provider_set
+        return tool_name.partition("_")[0].lower() in providers
 
-    def _filter_by_action(self, tool_name: str, actions: list[str]) -> bool:
+    def _filter_by_action(self, tool_name: str, actions: re.Pattern[str]) -> bool:
         """Check if a tool name matches any of the action patterns
 
         Args:
             tool_name: Name of the tool to check
-            actions: List of action patterns (supports glob patterns)
+            actions: Action glob patterns compiled by ``_compile_globs``
 
         Returns:
             True if the tool matches any action pattern, False otherwise
         """
-        return any(fnmatch.fnmatch(tool_name, pattern) for pattern in actions)
+        return actions.match(os.path.normcase(tool_name)) is not None
 
     def fetch_tools(
         self,
@@ -1258,10 +1312,13 @@ class StackOneToolSet:
                         all_tools.extend(future.result())
 
             if providers:
-                all_tools = [tool for tool in all_tools if self._filter_by_provider(tool.name, providers)]
+                provider_set = _provider_set(providers)
+                all_tools = [tool for tool in all_tools if self._filter_by_provider(tool.name, provider_set)]
 
             if actions:
-                all_tools = [tool for tool in all_tools if self._filter_by_action(tool.name, actions)]
+                # One regex for all patterns, so each tool name is matched once
+                action_re = _compile_globs(tuple(actions))
+                all_tools = [tool for tool in all_tools if self._filter_by_action(tool.name, action_re)]
 
             result = Tools(all_tools)
             self._catalog_cache[cache_key] = result
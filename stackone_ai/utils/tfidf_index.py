@@ -6,6 +6,7 @@ strips punctuation, removes a small stopword set, and builds a sparse index.
 
 from __future__ import annotations
 
+import heapq
 import math
 import re
 from typing import NamedTuple
@@ -100,7 +101,26 @@ class TfidfIndex:
     def __init__(self) -> None:
         self.vocab: dict[str, int] = {}
         self.idf: list[float] = []
-        self.docs: list[dict[str, str | dict[int, float] | float]] = []
+        # Inverted index: term_id -> [(doc_index, weight), ...]
+        self.postings: dict[int, list[tuple[int, float]]] = {}
+        self._doc_ids: list[str] = []
+        self._doc_norms: list[float] = []
+
+    @property
+    def docs(self) -> list[dict[str, str | dict[int, float] | float]]:
+        """Indexed documents as ``{"id", "vec", "norm"}`` records.
+
+        The postings lists hold the only copy of each weight, so the sparse ``vec``
+        of every document is rebuilt from them on each access.
+        """
+        vecs: list[dict[int, float]] = [{} for _ in self._doc_ids]
+        for term_id, postings in self.postings.items():
+            for doc_index, weight in postings:
+                vecs[doc_index][term_id] = weight
+        return [
+            {"id": doc_id, "vec": vec, "norm": norm}
+            for doc_id, vec, norm in zip(self._doc_ids, vecs, self._doc_norms, strict=True)
+        ]
 
     def build(self, corpus: list[TfidfDocument]) -> None:
         """Build index from a corpus of documents
@@ -136,9 +156,11 @@ class TfidfIndex:
             idf_value = math.log((n_docs + 1) / (dfi + 1)) + 1
             self.idf.append(idf_value)
 
-        # Build document vectors
-        self.docs = []
-        for doc, tokens in zip(corpus, docs_tokens, strict=True):
+        # Build document vectors and postings lists
+        self.postings = {}
+        self._doc_ids = []
+        self._doc_norms = []
+        for doc_index, (doc, tokens) in enumerate(zip(corpus, docs_tokens, strict=True)):
             # Compute term frequency (TF)
             tf: dict[int, int] = {}
             for token in tokens:
@@ -146,8 +168,7 @@ class TfidfIndex:
                 if term_id is not None:
                     tf[term_id] = tf.get(term_id, 0) + 1
 
-            # Build weighted vector (TF-IDF)
-            vec: dict[int, float] = {}
+            # Weight terms (TF-IDF); the postings lists are the only copy of each weight
             norm_sq = 0.0
             n_tokens = len(tokens)
 
@@ -157,18 +178,13 @@ class TfidfIndex:
                 idf_val = self.idf[term_id]
                 weight = (freq / n_tokens) * idf_val
                 if weight > 0:
-                    vec[term_id] = weight
                     norm_sq += weight * weight
+                    self.postings.setdefault(term_id, []).append((doc_index, weight))
 
             norm = math.sqrt(norm_sq) if norm_sq > 0 else 1.0
 
-            self.docs.append(
-                {
-                    "id": doc.id,
-                    "vec": vec,
-                    "norm": norm,
-                }
-            )
+            self._doc_ids.append(doc.id)
+            self._doc_norms.append(norm)
 
     def search(self, query: str, k: int = 10) -> list[TfidfResult]:
         """Search for documents similar to the query
@@ -210,33 +226,20 @@ class TfidfIndex:
 
         q_norm = math.sqrt(q_norm_sq) if q_norm_sq > 0 else 1.0
 
-        # Compute cosine similarity with each document
-        scores: list[TfidfResult] = []
-        for doc in self.docs:
-            doc_vec = doc["vec"]
-            doc_norm = doc["norm"]
-            if not isinstance(doc_vec, dict) or not isinstance(doc_norm, (int, float)):
-                continue
+        # Accumulate dot products only for documents sharing a query term
+        dots: dict[int, float] = {}
+        for term_id, weight in q_vec.items():
+            for doc_index, doc_weight in self.postings.get(term_id, ()):
+                dots[doc_index] = dots.get(doc_index, 0.0) + weight * doc_weight
 
-            # Compute dot product (iterate over smaller map for efficiency)
-            dot = 0.0
-            small_vec = q_vec if len(q_vec) <= len(doc_vec) else doc_vec
-            big_vec = doc_vec if len(q_vec) <= len(doc_vec) else q_vec
-
-            for term_id, weight in small_vec.items():
-                other_weight = big_vec.get(term_id)
-                if other_weight is not None:
-                    dot += weight * other_weight
-
-            # Cosine similarity
-            similarity = dot / (q_norm * doc_norm)
+        # Cosine similarity, visiting candidates in corpus order so ties keep a stable order
+        scores: list[TfidfResult] = []
+        for doc_index in sorted(dots):
+            similarity = dots[doc_index] / (q_norm * self._doc_norms[doc_index])
             if similarity > 0:
-                doc_id = doc["id"]
-                if isinstance(doc_id, str):
-                    # Clamp to [0, 1]
-                    clamped_score = max(0.0, min(1.0, similarity))
-                    scores.append(TfidfResult(id=doc_id, score=clamped_score))
-
-        # Sort by score descending and return top k
-        scores.sort(key=lambda x: x.score, reverse=True)
-        return scores[:k]
+                # Clamp to [0, 1]
+                clamped_score = max(0.0, min(1.0, similarity))
+                scores.append(TfidfResult(id=self._doc_ids[doc_index], score=clamped_score))
+
+        # Top k by score descending; equivalent to a stable sort + slice but O(n log k)
+        return heapq.nlargest(k, scores, key=lambda x: x.score)
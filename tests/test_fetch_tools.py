@@ -140,6 +140,36 @@ class TestProviderAndActionFiltering:
         assert "hibob_list_employees" in tool_names
 
 
+class TestFilteringWithPatchedFetch:
+    """Test fetch_tools filtering against a patched catalog (no MCP server needed)."""
+
+    @pytest.fixture
+    def toolset(self, monkeypatch) -> StackOneToolSet:
+        names = [
+            "hibob_list_employees",
+            "HiBob_create_employee",
+            "bamboohr_list_employees",
+            "workday",
+            "utility",
+        ]
+
+        def fake_fetch(_endpoint: str, _headers: dict[str, str]) -> list[_McpToolDefinition]:
+            return [_McpToolDefinition(name=name, description=name, input_schema={}) for name in names]
+
+        monkeypatch.setattr("stackone_ai.toolset._fetch_mcp_tools", fake_fetch)
+        return StackOneToolSet(api_key="test-key")
+
+    def test_provider_filter_is_case_insensitive(self, toolset: StackOneToolSet):
+        tools = toolset.fetch_tools(providers=["HIBOB", "Workday"])
+
+        assert [t.name for t in tools] == ["hibob_list_employees", "HiBob_create_employee", "workday"]
+
+    def test_action_filter_matches_any_glob(self, toolset: StackOneToolSet):
+        tools = toolset.fetch_tools(actions=["*_list_employees", "util*"])
+
+        assert [t.name for t in tools] == ["hibob_list_employees", "bamboohr_list_employees", "utility"]
+
+
 class TestMcpHeaders:
     """Test that MCP headers are built correctly."""
 
@@ -637,6 +667,58 @@ class TestToolIndexCache:
 
         assert build_count["count"] == 1
 
+    def test_tool_index_reused_for_identical_catalog(self, monkeypatch):
+        from stackone_ai import local_search as ls_module
+
+        def fake_fetch(_endpoint: str, _headers: dict[str, str]) -> list[_McpToolDefinition]:
+            return [
+                _McpToolDefinition(name="foo_list_bar", description="list bars", input_schema={}),
+            ]
+
+        monkeypatch.setattr("stackone_ai.toolset._fetch_mcp_tools", fake_fetch)
+
+        build_count = {"count": 0}
+        original_init = ls_module.ToolIndex.__init__
+
+        def counting_init(self, tools, hybrid_alpha=None):
+            build_count["count"] += 1
+            original_init(self, tools, hybrid_alpha)
+
+        monkeypatch.setattr(ls_module.ToolIndex, "__init__", counting_init)
+
+        toolset = StackOneToolSet(api_key="test-key", search={"method": "local"})
+        first = toolset.search_tools("bar")
+        toolset._catalog_cache.clear()
+        second = toolset.search_tools("bar")
+
+        assert build_count["count"] == 1
+        assert [t.name for t in first] == [t.name for t in second]
+
+    def test_tool_index_skips_fingerprint_for_same_catalog(self, monkeypatch):
+        from stackone_ai import toolset as toolset_module
+
+        def fake_fetch(_endpoint: str, _headers: dict[str, str]) -> list[_McpToolDefinition]:
+            return [
+                _McpToolDefinition(name="foo_list_bar", description="list bars", input_schema={}),
+            ]
+
+        monkeypatch.setattr("stackone_ai.toolset._fetch_mcp_tools", fake_fetch)
+
+        fingerprint_calls = {"count": 0}
+        original_fingerprint = toolset_module._tool_index_fingerprint
+
+        def counting_fingerprint(tools):
+            fingerprint_calls["count"] += 1
+            return original_fingerprint(tools)
+
+        monkeypatch.setattr(toolset_module, "_tool_index_fingerprint", counting_fingerprint)
+
+        toolset = StackOneToolSet(api_key="test-key", search={"method": "local"})
+        toolset.search_tools("bar")
+        toolset.search_tools("list")
+
+        assert fingerprint_calls["count"] == 1
+
     def test_tool_index_rebuilt_after_clear_catalog_cache(self, monkeypatch):
         from stackone_ai import local_search as ls_module
 
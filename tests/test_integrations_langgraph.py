@@ -3,6 +3,7 @@
 from __future__ import annotations
 
 from collections.abc import Sequence
+from importlib.util import find_spec
 from unittest.mock import MagicMock, patch
 
 import pytest
@@ -10,6 +11,9 @@ from langchain_core.tools import BaseTool as LangChainBaseTool
 
 from stackone_ai.models import ExecuteConfig, StackOneTool, ToolParameters, Tools
 
+# langgraph is an optional extra; only the helpers that build LangGraph objects need it
+requires_langgraph = pytest.mark.skipif(find_spec("langgraph") is None, reason="langgraph not installed")
+
 
 @pytest.fixture
 def sample_tool() -> StackOneTool:
@@ -63,6 +67,7 @@ class TestToLangchainTools:
         assert len(result) == 1
 
 
+@requires_langgraph
 class TestToToolNode:
     """Test to_tool_node function."""
 
@@ -98,6 +103,7 @@ class TestToToolNode:
         assert node is not None
 
 
+@requires_langgraph
 class TestToToolExecutor:
     """Test to_tool_executor function (deprecated, returns ToolNode)."""
 
@@ -145,6 +151,7 @@ class TestBindModelWithTools:
         mock_model.bind_tools.assert_called_once_with(lc_tools)
 
 
+@requires_langgraph
 class TestCreateReactAgent:
     """Test create_react_agent function."""
 
@@ -188,14 +195,14 @@ class TestEnsureLanggraph:
         from stackone_ai.integrations.langgraph import _ensure_langgraph
 
         with patch.dict("sys.modules", {"langgraph": None, "langgraph.prebuilt": None}):
-            with patch(
-                "stackone_ai.integrations.langgraph._ensure_langgraph",
-                side_effect=ImportError("LangGraph is not installed"),
-            ):
-                # This test verifies the error message format
-                pass
-
-        # Since langgraph is installed in the test environment, just verify function runs
+            with pytest.raises(ImportError, match="LangGraph is not installed"):
+                _ensure_langgraph()
+
+    @requires_langgraph
+    def test_passes_when_langgraph_installed(self):
+        """Test that no error is raised when langgraph is importable."""
+        from stackone_ai.integrations.langgraph import _ensure_langgraph
+
         _ensure_langgraph()  # Should not raise
 
 
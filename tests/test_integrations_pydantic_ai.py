@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+import pickle
 from typing import Any
 from unittest.mock import MagicMock
 
@@ -64,6 +65,61 @@ def test_tool_to_pydantic_ai_tool_schema_matches_openai(sample_tool: StackOneToo
     assert tool.function_schema.json_schema == sample_tool.to_openai_function()["function"]["parameters"]
 
 
+def test_tool_to_pydantic_ai_tool_is_cached(sample_tool: StackOneTool, second_tool: StackOneTool):
+    tool = sample_tool.to_pydantic_ai_tool()
+    assert sample_tool.to_pydantic_ai_tool() is tool
+    assert second_tool.to_pydantic_ai_tool() is not tool
+
+
+def test_tool_to_pydantic_ai_tool_rebuilt_after_field_change(sample_tool: StackOneTool):
+    tool = sample_tool.to_pydantic_ai_tool()
+    sample_tool.description = "List all employees"
+
+    rebuilt = sample_tool.to_pydantic_ai_tool()
+    assert rebuilt is not tool
+    assert rebuilt.description == "List all employees"
+
+
+def test_tool_to_pydantic_ai_tool_rebuilt_after_in_place_schema_change(sample_tool: StackOneTool):
+    tool = sample_tool.to_pydantic_ai_tool()
+    sample_tool.parameters.properties["offset"] = {"type": "integer", "description": "Skip results"}
+
+    rebuilt = sample_tool.to_pydantic_ai_tool()
+    assert rebuilt is not tool
+    assert set(rebuilt.function_schema.json_schema["properties"]) == {"limit", "offset"}
+
+
+def test_tool_pickles_after_pydantic_ai_conversion(sample_tool: StackOneTool):
+    sample_tool.to_pydantic_ai_tool()
+
+    restored = pickle.loads(pickle.dumps(sample_tool))
+
+    assert restored == sample_tool
+    assert restored.to_pydantic_ai_tool().name == "bamboohr_list_employees"
+
+
+@pytest.mark.parametrize("deep", [False, True])
+def test_copied_tool_converts_to_its_own_pydantic_ai_tool(
+    sample_tool: StackOneTool, monkeypatch: pytest.MonkeyPatch, deep: bool
+):
+    executed_by: list[StackOneTool] = []
+
+    def fake_execute(self: StackOneTool, arguments: dict[str, Any]) -> Any:
+        executed_by.append(self)
+        return {"ok": True}
+
+    monkeypatch.setattr(StackOneTool, "execute", fake_execute)
+
+    original = sample_tool.to_pydantic_ai_tool()
+    copied_tool = sample_tool.model_copy(deep=deep)
+    converted = copied_tool.to_pydantic_ai_tool()
+    converted.function(limit=1)  # type: ignore[operator]
+
+    assert converted is not original
+    assert len(executed_by) == 1
+    assert executed_by[0] is copied_tool
+
+
 def test_tool_to_pydantic_ai_tool_executes_through_stackone(
     sample_tool: StackOneTool, monkeypatch: pytest.MonkeyPatch
 ):
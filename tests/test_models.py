@@ -17,6 +17,9 @@ from stackone_ai.models import (
     ToolDefinition,
     ToolParameters,
     Tools,
+    _get_http_client,
+    _reset_http_client_after_fork,
+    close_http_client,
     validate_method,
 )
 
@@ -123,7 +126,7 @@ def mock_specs() -> dict:
 
 def test_tool_execution(mock_tool):
     """Test tool execution with parameters"""
-    with patch("httpx.request") as mock_request:
+    with patch("httpx.Client.request") as mock_request:
         mock_response = MagicMock()
         mock_response.json.return_value = {"id": "123", "name": "Test User"}
         mock_response.status_code = 200
@@ -138,7 +141,7 @@ def test_tool_execution(mock_tool):
 
 def test_tool_execution_with_string_args(mock_tool):
     """Test tool execution with string arguments"""
-    with patch("httpx.request") as mock_request:
+    with patch("httpx.Client.request") as mock_request:
         mock_response = MagicMock()
         mock_response.json.return_value = {"id": "123", "name": "Test User"}
         mock_response.status_code = 200
@@ -151,6 +154,64 @@ def test_tool_execution_with_string_args(mock_tool):
         mock_request.assert_called_once()
 
 
+def test_tool_execution_reuses_http_client(mock_tool):
+    """Test tool executions share one pooled HTTP client"""
+    with patch("httpx.Client.request", autospec=True) as mock_request:
+        mock_response = MagicMock()
+        mock_response.json.return_value = {"ok": True}
+        mock_request.return_value = mock_response
+
+        mock_tool.execute({"id": "1"})
+        mock_tool.execute({"id": "2"})
+
+    assert mock_request.call_count == 2
+    first_client, second_client = (call.args[0] for call in mock_request.call_args_list)
+    assert first_client is second_client
+
+
+def test_shared_http_client_does_not_replay_cookies(mock_tool):
+    """Test a cookie set on one tool call is not sent with the next one"""
+    sent_cookies: list[str | None] = []
+
+    def handle_request(transport: httpx.HTTPTransport, request: httpx.Request) -> httpx.Response:
+        sent_cookies.append(request.headers.get("cookie"))
+        return httpx.Response(
+            200,
+            json={"ok": True},
+            headers={"set-cookie": "session=abc; Path=/"},
+            request=request,
+        )
+
+    close_http_client()
+    with patch.object(httpx.HTTPTransport, "handle_request", autospec=True, side_effect=handle_request):
+        mock_tool.execute({"id": "1"})
+        mock_tool.execute({"id": "2"})
+
+    assert sent_cookies == [None, None]
+    assert not _get_http_client().cookies
+
+
+def test_close_http_client_releases_shared_client():
+    """Test closing the shared client and recreating it on next use"""
+    client = _get_http_client()
+
+    close_http_client()
+
+    assert client.is_closed
+    assert _get_http_client() is not client
+
+
+def test_forked_child_gets_fresh_http_client():
+    """Test the after-fork hook drops the parent's client without closing it"""
+    client = _get_http_client()
+
+    _reset_http_client_after_fork()
+
+    assert not client.is_closed
+    assert _get_http_client() is not client
+    client.close()
+
+
 def test_tool_openai_function_conversion(mock_tool):
     """Test conversion of tool to OpenAI function format"""
     openai_format = mock_tool.to_openai_function()
@@ -209,7 +270,7 @@ async def test_langchain_tool_execution(mock_tool):
     langchain_tool = langchain_tools[0]
 
     # Mock the HTTP request
-    with patch("httpx.request") as mock_request:
+    with patch("httpx.Client.request") as mock_request:
         mock_response = MagicMock()
         mock_response.json.return_value = {"id": "test_value", "name": "Test User"}
         mock_response.status_code = 200
@@ -338,7 +399,7 @@ class TestStackOneToolExecution:
 
     def test_parameter_location_path(self, tool_with_locations):
         """Test PATH parameter location handling"""
-        with patch("httpx.request") as mock_request:
+        with patch("httpx.Client.request") as mock_request:
             mock_response = MagicMock()
             mock_response.json.return_value = {"success": True}
             mock_response.status_code = 200
@@ -373,7 +434,7 @@ class TestStackOneToolExecution:
             _account_id="acc123",
         )
 
-        with patch("httpx.request") as mock_request:
+        with patch("httpx.Client.request") as mock_request:
             mock_response = MagicMock()
             mock_response.json.return_value = {}
             mock_response.status_code = 200
@@ -457,7 +518,7 @@ class TestStackOneToolExecution:
             _api_key="test_key",
         )
 
-        with patch("httpx.request") as mock_request:
+        with patch("httpx.Client.request") as mock_request:
             mock_response = MagicMock()
             mock_response.json.return_value = {}
             mock_response.status_code = 200
@@ -472,7 +533,7 @@ class TestStackOneToolExecution:
 
     def test_http_status_error_with_json_body(self, mock_tool):
         """Test HTTP error with JSON response body"""
-        with patch("httpx.request") as mock_request:
+        with patch("httpx.Client.request") as mock_request:
             mock_response = MagicMock()
             mock_response.status_code = 400
             mock_response.text = '{"error": "Bad request"}'
@@ -494,7 +555,7 @@ class TestStackOneToolExecution:
         """Test HTTP error with plain text response body"""
         import json as json_module
 
-        with patch("httpx.request") as mock_request:
+        with patch("httpx.Client.request") as mock_request:
             mock_response = MagicMock()
             mock_response.status_code = 500
             mock_response.text = "Internal Server Error"
@@ -514,7 +575,7 @@ class TestStackOneToolExecution:
 
     def test_request_error(self, mock_tool):
         """Test network/request error handling"""
-        with patch("httpx.request") as mock_request:
+        with patch("httpx.Client.request") as mock_request:
             mock_request.side_effect = httpx.RequestError("Connection failed")
 
             with pytest.raises(StackOneError, match="Request failed"):
@@ -522,7 +583,7 @@ class TestStackOneToolExecution:
 
     def test_non_dict_response(self, mock_tool):
         """Test non-dict JSON response is wrapped"""
-        with patch("httpx.request") as mock_request:
+        with patch("httpx.Client.request") as mock_request:
             mock_response = MagicMock()
             mock_response.json.return_value = ["item1", "item2"]
             mock_response.status_code = 200
@@ -747,7 +808,7 @@ class TestStackOneToolLangChainConversion:
 
         lc_tool = tool.to_langchain()
 
-        with patch("httpx.request") as mock_request:
+        with patch("httpx.Client.request") as mock_request:
             mock_response = MagicMock()
             mock_response.json.return_value = {"result": "async_test"}
             mock_response.status_code = 200
@@ -830,7 +891,7 @@ class TestStackOneToolFeedbackOptions:
             _api_key="test_key",
         )
 
-        with patch("httpx.request") as mock_request:
+        with patch("httpx.Client.request") as mock_request:
             mock_response = MagicMock()
             mock_response.json.return_value = {"success": True}
             mock_response.status_code = 200
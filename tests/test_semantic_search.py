@@ -2,18 +2,81 @@
 
 from __future__ import annotations
 
-from unittest.mock import MagicMock, patch
+import json
+from collections.abc import Callable
+from typing import Any
+from unittest.mock import MagicMock, Mock, patch
 
 import httpx
 import pytest
 
+from stackone_ai import StackOneToolSet
 from stackone_ai.constants import DEFAULT_BASE_URL
+from stackone_ai.models import ExecuteConfig, StackOneTool, ToolParameters, Tools
 from stackone_ai.semantic_search import (
     SemanticSearchClient,
     SemanticSearchError,
     SemanticSearchResponse,
     SemanticSearchResult,
 )
+from stackone_ai.toolset import _McpToolDefinition
+from stackone_ai.utils.normalize import _normalize_action_name
+
+# Composite action IDs returned by the search API for the create-employee query
+_BAMBOOHR_ID = "bamboohr_1.0.0_bamboohr_create_employee_global"
+_HIBOB_ID = "hibob_1.0.0_hibob_create_employee_global"
+
+_EMPTY_SCHEMA: dict[str, Any] = {"type": "object", "properties": {}}
+
+
+def _mcp_tool(name: str, description: str) -> _McpToolDefinition:
+    """Build an MCP tool definition with no parameters, sharing one read-only schema dict."""
+    return _McpToolDefinition(name=name, description=description, input_schema=_EMPTY_SCHEMA)
+
+
+def _make_tool(name: str) -> StackOneTool:
+    """Build a minimal StackOneTool whose only meaningful attribute is its name."""
+    return StackOneTool(
+        description=f"Tool {name}",
+        parameters=ToolParameters(type="object", properties={}),
+        _execute_config=ExecuteConfig(name=name, method="POST", url="https://api.example.com", headers={}),
+        _api_key="test-key",
+    )
+
+
+def _result(id: str, similarity_score: float) -> SemanticSearchResult:
+    """Build a trusted search result without running pydantic validation."""
+    return SemanticSearchResult.model_construct(id=id, similarity_score=similarity_score)
+
+
+def _response(results: list[SemanticSearchResult], total_count: int, query: str) -> SemanticSearchResponse:
+    """Build a trusted search response without running pydantic validation."""
+    return SemanticSearchResponse.model_construct(results=results, total_count=total_count, query=query)
+
+
+@pytest.fixture
+def toolset() -> StackOneToolSet:
+    """Fresh search-enabled toolset; function-scoped so catalog and index caches never leak across tests."""
+    return StackOneToolSet(api_key="test-key", search={"method": "auto"})
+
+
+def _mock_client(
+    handler: Callable[[httpx.Request], httpx.Response], **kwargs: Any
+) -> tuple[SemanticSearchClient, list[httpx.Request]]:
+    """Build a client backed by an in-process MockTransport, recording every request sent."""
+    sent: list[httpx.Request] = []
+
+    def _record(request: httpx.Request) -> httpx.Response:
+        sent.append(request)
+        return handler(request)
+
+    http_client = httpx.Client(transport=httpx.MockTransport(_record))
+    return SemanticSearchClient(api_key="test-key", http_client=http_client, **kwargs), sent
+
+
+def _respond(payload: dict[str, Any]) -> Callable[[httpx.Request], httpx.Response]:
+    """Handler that answers every request with the same JSON payload."""
+    return lambda request: httpx.Response(200, json=payload)
 
 
 class TestSemanticSearchResult:
@@ -22,11 +85,11 @@ class TestSemanticSearchResult:
     def test_create_result(self) -> None:
         """Test creating a search result."""
         result = SemanticSearchResult(
-            id="bamboohr_1.0.0_bamboohr_create_employee_global",
+            id=_BAMBOOHR_ID,
             similarity_score=0.92,
         )
 
-        assert result.id == "bamboohr_1.0.0_bamboohr_create_employee_global"
+        assert result.id == _BAMBOOHR_ID
         assert result.similarity_score == 0.92
 
 
@@ -37,11 +100,11 @@ class TestSemanticSearchResponse:
         """Test creating a search response."""
         results = [
             SemanticSearchResult(
-                id="bamboohr_1.0.0_bamboohr_create_employee_global",
+                id=_BAMBOOHR_ID,
                 similarity_score=0.92,
             ),
             SemanticSearchResult(
-                id="hibob_1.0.0_hibob_create_employee_global",
+                id=_HIBOB_ID,
                 similarity_score=0.85,
             ),
         ]
@@ -76,135 +139,233 @@ class TestSemanticSearchClient:
 
         assert client.base_url == "https://custom.api.com"  # Trailing slash stripped
 
-    def test_build_auth_header(self) -> None:
+    @pytest.mark.parametrize(
+        ("api_key", "expected"),
+        [
+            # "test-key:" encoded in base64
+            ("test-key", "Basic dGVzdC1rZXk6"),
+            # An empty key still encodes the trailing colon
+            ("", "Basic Og=="),
+        ],
+    )
+    def test_build_auth_header(self, api_key: str, expected: str) -> None:
         """Test building the authorization header."""
-        client = SemanticSearchClient(api_key="test-key")
-        header = client._build_auth_header()
+        client = SemanticSearchClient(api_key=api_key)
+
+        assert client._build_auth_header() == expected
 
-        # test-key: encoded in base64 = dGVzdC1rZXk6
-        assert header == "Basic dGVzdC1rZXk6"
+    def test_http_client_is_pooled(self) -> None:
+        """Test the underlying httpx client is created lazily and reused."""
+        client = SemanticSearchClient(api_key="test-key", timeout=12.0)
+        assert client._client is None
 
-    @patch("httpx.post")
-    def test_search_success(self, mock_post: MagicMock) -> None:
+        http_client = client._get_client()
+
+        assert client._get_client() is http_client
+        assert http_client.timeout == httpx.Timeout(12.0)
+
+    def test_uses_injected_http_client(self) -> None:
+        """Test a caller-supplied httpx client is used instead of creating one."""
+        http_client = httpx.Client()
+        client = SemanticSearchClient(api_key="test-key", http_client=http_client)
+
+        assert client._get_client() is http_client
+
+    def test_close_releases_pooled_client_only(self) -> None:
+        """Test close() shuts the client it created but leaves an injected one open."""
+        with SemanticSearchClient(api_key="test-key") as client:
+            pooled = client._get_client()
+        assert pooled.is_closed
+        assert client._client is None
+
+        injected = httpx.Client()
+        SemanticSearchClient(api_key="test-key", http_client=injected).close()
+        assert not injected.is_closed
+
+    def test_search_success(self) -> None:
         """Test successful search request."""
-        mock_response = MagicMock()
-        mock_response.json.return_value = {
-            "results": [
+        client, sent = _mock_client(
+            _respond(
                 {
-                    "id": "bamboohr_1.0.0_bamboohr_create_employee_global",
-                    "similarity_score": 0.92,
+                    "results": [
+                        {
+                            "id": _BAMBOOHR_ID,
+                            "similarity_score": 0.92,
+                        }
+                    ],
+                    "total_count": 1,
+                    "query": "create employee",
                 }
-            ],
-            "total_count": 1,
-            "query": "create employee",
-        }
-        mock_response.raise_for_status = MagicMock()
-        mock_post.return_value = mock_response
-
-        client = SemanticSearchClient(api_key="test-key")
+            )
+        )
         response = client.search("create employee", top_k=5)
 
         assert len(response.results) == 1
-        assert response.results[0].id == "bamboohr_1.0.0_bamboohr_create_employee_global"
+        assert response.results[0].id == _BAMBOOHR_ID
         assert response.total_count == 1
         assert response.query == "create employee"
 
         # Verify request was made correctly
-        mock_post.assert_called_once()
-        call_kwargs = mock_post.call_args
-        assert call_kwargs.kwargs["json"] == {"query": "create employee", "top_k": 5}
-        assert "Authorization" in call_kwargs.kwargs["headers"]
+        assert len(sent) == 1
+        assert sent[0].url == f"{DEFAULT_BASE_URL}/actions/search"
+        assert json.loads(sent[0].content) == {"query": "create employee", "top_k": 5}
+        assert "Authorization" in sent[0].headers
 
-    @patch("httpx.post")
-    def test_search_with_connector(self, mock_post: MagicMock) -> None:
+    def test_search_with_connector(self) -> None:
         """Test search with connector filter."""
-        mock_response = MagicMock()
-        mock_response.json.return_value = {
-            "results": [],
-            "total_count": 0,
-            "query": "create employee",
-        }
-        mock_response.raise_for_status = MagicMock()
-        mock_post.return_value = mock_response
-
-        client = SemanticSearchClient(api_key="test-key")
+        client, sent = _mock_client(_respond({"results": [], "total_count": 0, "query": "create employee"}))
         client.search("create employee", connector="bamboohr", top_k=10)
 
-        call_kwargs = mock_post.call_args
-        assert call_kwargs.kwargs["json"] == {
+        assert json.loads(sent[0].content) == {
             "query": "create employee",
             "connector": "bamboohr",
             "top_k": 10,
         }
 
-    @patch("httpx.post")
-    def test_search_http_error(self, mock_post: MagicMock) -> None:
+    def test_search_http_error(self) -> None:
         """Test search with HTTP error."""
-        mock_response = MagicMock()
-        mock_response.status_code = 401
-        mock_response.text = "Unauthorized"
-        mock_post.return_value = mock_response
-        mock_response.raise_for_status.side_effect = httpx.HTTPStatusError(
-            "Unauthorized",
-            request=MagicMock(),
-            response=mock_response,
-        )
-
-        client = SemanticSearchClient(api_key="invalid-key")
+        client, _ = _mock_client(lambda request: httpx.Response(401, text="Unauthorized"))
 
         with pytest.raises(SemanticSearchError) as exc_info:
             client.search("create employee")
 
         assert "API error: 401" in str(exc_info.value)
 
-    @patch("httpx.post")
-    def test_search_request_error(self, mock_post: MagicMock) -> None:
+    def test_search_request_error(self) -> None:
         """Test search with request error."""
-        mock_post.side_effect = httpx.RequestError("Connection failed")
 
-        client = SemanticSearchClient(api_key="test-key")
+        def _fail(request: httpx.Request) -> httpx.Response:
+            raise httpx.ConnectError("Connection failed", request=request)
+
+        client, _ = _mock_client(_fail)
 
         with pytest.raises(SemanticSearchError) as exc_info:
             client.search("create employee")
 
         assert "Request failed" in str(exc_info.value)
 
-    @patch("httpx.post")
-    def test_search_action_names(self, mock_post: MagicMock) -> None:
+    def test_search_invalid_response_body(self) -> None:
+        """Test a malformed response body surfaces as a SemanticSearchError."""
+        client, _ = _mock_client(lambda request: httpx.Response(200, content=b'{"results": ['))
+
+        with pytest.raises(SemanticSearchError, match="Search failed"):
+            client.search("create employee")
+
+    def test_search_action_names(self) -> None:
         """Test search_action_names convenience method."""
-        mock_response = MagicMock()
-        mock_response.json.return_value = {
-            "results": [
-                {
-                    "id": "bamboohr_1.0.0_bamboohr_create_employee_global",
-                    "similarity_score": 0.92,
-                },
+        client, sent = _mock_client(
+            _respond(
                 {
-                    "id": "hibob_1.0.0_hibob_create_employee_global",
-                    "similarity_score": 0.45,
-                },
-            ],
-            "total_count": 2,
-            "query": "create employee",
-        }
-        mock_response.raise_for_status = MagicMock()
-        mock_post.return_value = mock_response
-
-        client = SemanticSearchClient(api_key="test-key")
+                    "results": [
+                        {
+                            "id": _BAMBOOHR_ID,
+                            "similarity_score": 0.92,
+                        },
+                        {
+                            "id": _HIBOB_ID,
+                            "similarity_score": 0.45,
+                        },
+                    ],
+                    "total_count": 2,
+                    "query": "create employee",
+                }
+            )
+        )
 
         # Without min_similarity — returns all results
         names = client.search_action_names("create employee")
         assert len(names) == 2
-        assert "bamboohr_1.0.0_bamboohr_create_employee_global" in names
-        assert "hibob_1.0.0_hibob_create_employee_global" in names
+        assert _BAMBOOHR_ID in names
+        assert _HIBOB_ID in names
 
         # With min_similarity — passes threshold to server
         names = client.search_action_names("create employee", min_similarity=0.5)
         assert len(names) == 2  # Mock returns same data; filtering is server-side
         # Verify min_similarity was sent in the request payload
-        last_call_kwargs = mock_post.call_args
-        payload = last_call_kwargs.kwargs.get("json") or last_call_kwargs[1].get("json")
-        assert payload["min_similarity"] == 0.5
+        assert json.loads(sent[-1].content)["min_similarity"] == 0.5
+
+    def test_search_caches_identical_requests(self) -> None:
+        """Test repeated identical searches are served from the response cache."""
+        client, sent = _mock_client(_respond({"results": [], "total_count": 0, "query": "q"}), cache_size=128)
+
+        first = client.search("q", connector="bamboohr", top_k=5)
+        second = client.search("q", connector="bamboohr", top_k=5)
+        client.search("q", connector="hibob", top_k=5)
+
+        assert first == second
+        assert first is not second
+        assert len(sent) == 2
+        assert client.cache_info() == (1, 2, 128, 2)
+
+        client.clear_cache()
+        assert client.cache_info().currsize == 0
+        client.search("q", connector="bamboohr", top_k=5)
+        assert len(sent) == 3
+
+    def test_search_cache_disabled_by_default(self) -> None:
+        """Test every search reaches the server unless a cache size is configured."""
+        client, sent = _mock_client(_respond({"results": [], "total_count": 0, "query": "q"}))
+
+        client.search("q", top_k=5)
+        client.search("q", top_k=5)
+
+        assert len(sent) == 2
+        assert client.cache_info() == (0, 2, 0, 0)
+
+    def test_search_cache_keys_on_exact_query(self) -> None:
+        """Test queries differing only in case or padding are sent to the server separately."""
+        client, sent = _mock_client(_respond({"results": [], "total_count": 0, "query": "q"}), cache_size=128)
+
+        client.search("Create Employee", top_k=5)
+        client.search("  create employee ", top_k=5)
+
+        assert [json.loads(r.content)["query"] for r in sent] == ["Create Employee", "  create employee "]
+        assert client.cache_info().hits == 0
+
+    def test_search_cache_hit_returns_independent_copy(self) -> None:
+        """Test mutating a returned response never leaks into later cache hits."""
+        client, _ = _mock_client(
+            _respond(
+                {"results": [{"id": _BAMBOOHR_ID, "similarity_score": 0.9}], "total_count": 1, "query": "q"}
+            ),
+            cache_size=128,
+        )
+
+        first = client.search("create employee")
+        first.results.clear()
+        second = client.search("create employee")
+
+        assert [r.id for r in second.results] == [_BAMBOOHR_ID]
+
+    def test_search_cache_entries_expire(self) -> None:
+        """Test cached responses are refetched once cache_ttl has elapsed."""
+        client, sent = _mock_client(
+            _respond({"results": [], "total_count": 0, "query": "q"}), cache_size=128, cache_ttl=60.0
+        )
+
+        with patch("stackone_ai.semantic_search.time.monotonic", return_value=1000.0):
+            client.search("q")
+            client.search("q")
+        with patch("stackone_ai.semantic_search.time.monotonic", return_value=1061.0):
+            client.search("q")
+
+        assert len(sent) == 2
+        assert client.cache_info() == (1, 2, 128, 1)
+
+    def test_search_cache_evicts_least_recently_used(self) -> None:
+        """Test the cache is bounded and cache_size=0 disables it."""
+        handler = _respond({"results": [], "total_count": 0, "query": "q"})
+
+        client, sent = _mock_client(handler, cache_size=1)
+        client.search("a")
+        client.search("b")
+        client.search("a")
+        assert len(sent) == 3
+
+        uncached, sent = _mock_client(handler, cache_size=0)
+        uncached.search("a")
+        uncached.search("a")
+        assert len(sent) == 2
 
 
 class TestSemanticSearchIntegration:
@@ -212,8 +373,6 @@ class TestSemanticSearchIntegration:
 
     def test_toolset_semantic_client_lazy_init(self) -> None:
         """Test that semantic_client is lazily initialized."""
-        from stackone_ai import StackOneToolSet
-
         toolset = StackOneToolSet(api_key="test-key")
 
         # Access semantic_client
@@ -224,25 +383,31 @@ class TestSemanticSearchIntegration:
         # Same instance on second access
         assert toolset.semantic_client is client
 
+    def test_toolset_semantic_client_uses_search_cache_config(self) -> None:
+        """Test cache_size and cache_ttl in the search config reach the semantic client."""
+        toolset = StackOneToolSet(api_key="test-key", search={"cache_size": 16, "cache_ttl": None})
+
+        assert toolset.semantic_client.cache_size == 16
+        assert toolset.semantic_client.cache_ttl is None
+
     @patch.object(SemanticSearchClient, "search")
     @patch("stackone_ai.toolset._fetch_mcp_tools")
     def test_toolset_search_tools(
         self,
         mock_fetch: MagicMock,
         mock_search: MagicMock,
+        toolset: StackOneToolSet,
     ) -> None:
         """Test toolset.search_tools() method with connector filtering."""
-        from stackone_ai import StackOneToolSet
-        from stackone_ai.toolset import _McpToolDefinition
 
         # Mock semantic search to return per-connector results
         def _search_side_effect(**kwargs: str) -> SemanticSearchResponse:
             c = kwargs.get("connector")
             if c == "bamboohr":
-                return SemanticSearchResponse(
+                return _response(
                     results=[
-                        SemanticSearchResult(
-                            id="bamboohr_1.0.0_bamboohr_create_employee_global",
+                        _result(
+                            id=_BAMBOOHR_ID,
                             similarity_score=0.95,
                         ),
                     ],
@@ -250,40 +415,27 @@ class TestSemanticSearchIntegration:
                     query=kwargs.get("query", ""),
                 )
             elif c == "hibob":
-                return SemanticSearchResponse(
+                return _response(
                     results=[
-                        SemanticSearchResult(
-                            id="hibob_1.0.0_hibob_create_employee_global",
+                        _result(
+                            id=_HIBOB_ID,
                             similarity_score=0.85,
                         ),
                     ],
                     total_count=1,
                     query=kwargs.get("query", ""),
                 )
-            return SemanticSearchResponse(results=[], total_count=0, query=kwargs.get("query", ""))
+            return _response(results=[], total_count=0, query=kwargs.get("query", ""))
 
         mock_search.side_effect = _search_side_effect
 
         # Mock MCP fetch to return only bamboohr and hibob tools (user's linked accounts)
         mock_fetch.return_value = [
-            _McpToolDefinition(
-                name="bamboohr_create_employee",
-                description="Creates a new employee",
-                input_schema={"type": "object", "properties": {}},
-            ),
-            _McpToolDefinition(
-                name="hibob_create_employee",
-                description="Creates a new employee",
-                input_schema={"type": "object", "properties": {}},
-            ),
-            _McpToolDefinition(
-                name="bamboohr_list_employees",
-                description="Lists employees",
-                input_schema={"type": "object", "properties": {}},
-            ),
+            _mcp_tool("bamboohr_create_employee", "Creates a new employee"),
+            _mcp_tool("hibob_create_employee", "Creates a new employee"),
+            _mcp_tool("bamboohr_list_employees", "Lists employees"),
         ]
 
-        toolset = StackOneToolSet(api_key="test-key", search={"method": "auto"})
         tools = toolset.search_tools("create employee", top_k=5)
 
         # Should only return tools for available connectors (bamboohr, hibob)
@@ -304,34 +456,19 @@ class TestSemanticSearchIntegration:
         self,
         mock_fetch: MagicMock,
         mock_search: MagicMock,
+        toolset: StackOneToolSet,
     ) -> None:
         """Test search_tools() fallback when semantic search fails."""
-        from stackone_ai import StackOneToolSet
-        from stackone_ai.toolset import _McpToolDefinition
-
         # Semantic search raises an error to trigger fallback
         mock_search.side_effect = SemanticSearchError("API unavailable")
 
         # Mock MCP fetch to return tools from multiple connectors
         mock_fetch.return_value = [
-            _McpToolDefinition(
-                name="bamboohr_create_employee",
-                description="Creates a new employee in BambooHR",
-                input_schema={"type": "object", "properties": {}},
-            ),
-            _McpToolDefinition(
-                name="bamboohr_list_employees",
-                description="Lists all employees in BambooHR",
-                input_schema={"type": "object", "properties": {}},
-            ),
-            _McpToolDefinition(
-                name="workday_create_worker",
-                description="Creates a new worker in Workday",
-                input_schema={"type": "object", "properties": {}},
-            ),
+            _mcp_tool("bamboohr_create_employee", "Creates a new employee in BambooHR"),
+            _mcp_tool("bamboohr_list_employees", "Lists all employees in BambooHR"),
+            _mcp_tool("workday_create_worker", "Creates a new worker in Workday"),
         ]
 
-        toolset = StackOneToolSet(api_key="test-key", search={"method": "auto"})
         tools = toolset.search_tools("create employee", top_k=5, search="auto")
 
         # Should return results from the local BM25+TF-IDF fallback
@@ -348,32 +485,17 @@ class TestSemanticSearchIntegration:
         self,
         mock_fetch: MagicMock,
         mock_search: MagicMock,
+        toolset: StackOneToolSet,
     ) -> None:
         """Test BM25 fallback filters to the requested connector."""
-        from stackone_ai import StackOneToolSet
-        from stackone_ai.toolset import _McpToolDefinition
-
         mock_search.side_effect = SemanticSearchError("API unavailable")
 
         mock_fetch.return_value = [
-            _McpToolDefinition(
-                name="bamboohr_create_employee",
-                description="Creates a new employee in BambooHR",
-                input_schema={"type": "object", "properties": {}},
-            ),
-            _McpToolDefinition(
-                name="bamboohr_list_employees",
-                description="Lists all employees in BambooHR",
-                input_schema={"type": "object", "properties": {}},
-            ),
-            _McpToolDefinition(
-                name="workday_create_worker",
-                description="Creates a new worker in Workday",
-                input_schema={"type": "object", "properties": {}},
-            ),
+            _mcp_tool("bamboohr_create_employee", "Creates a new employee in BambooHR"),
+            _mcp_tool("bamboohr_list_employees", "Lists all employees in BambooHR"),
+            _mcp_tool("workday_create_worker", "Creates a new worker in Workday"),
         ]
 
-        toolset = StackOneToolSet(api_key="test-key", search={"method": "auto"})
         tools = toolset.search_tools("create employee", connector="bamboohr", search="auto")
 
         assert len(tools) > 0
@@ -387,22 +509,15 @@ class TestSemanticSearchIntegration:
         self,
         mock_fetch: MagicMock,
         mock_search: MagicMock,
+        toolset: StackOneToolSet,
     ) -> None:
         """Test search_tools() raises when fallback is disabled."""
-        from stackone_ai import StackOneToolSet
-        from stackone_ai.toolset import _McpToolDefinition
-
         mock_search.side_effect = SemanticSearchError("API unavailable")
         # Must provide tools so the flow reaches the semantic search call
         mock_fetch.return_value = [
-            _McpToolDefinition(
-                name="bamboohr_create_employee",
-                description="Creates a new employee",
-                input_schema={"type": "object", "properties": {}},
-            ),
+            _mcp_tool("bamboohr_create_employee", "Creates a new employee"),
         ]
 
-        toolset = StackOneToolSet(api_key="test-key", search={"method": "auto"})
         with pytest.raises(SemanticSearchError):
             toolset.search_tools("create employee", search="semantic")
 
@@ -412,18 +527,18 @@ class TestSemanticSearchIntegration:
         self,
         mock_fetch: MagicMock,
         mock_search: MagicMock,
+        toolset: StackOneToolSet,
     ) -> None:
         """Test toolset.search_action_names() method."""
-        from stackone_ai import StackOneToolSet
 
-        mock_search.return_value = SemanticSearchResponse(
+        mock_search.return_value = _response(
             results=[
-                SemanticSearchResult(
-                    id="bamboohr_1.0.0_bamboohr_create_employee_global",
+                _result(
+                    id=_BAMBOOHR_ID,
                     similarity_score=0.92,
                 ),
-                SemanticSearchResult(
-                    id="hibob_1.0.0_hibob_create_employee_global",
+                _result(
+                    id=_HIBOB_ID,
                     similarity_score=0.45,
                 ),
             ],
@@ -431,14 +546,13 @@ class TestSemanticSearchIntegration:
             query="create employee",
         )
 
-        toolset = StackOneToolSet(api_key="test-key", search={"method": "auto"})
         results = toolset.search_action_names("create employee", min_similarity=0.5)
 
         # min_similarity is passed to server; mock returns both results
         # Verify results are normalized
         assert len(results) == 2
-        assert results[0].id == "bamboohr_1.0.0_bamboohr_create_employee_global"
-        assert results[1].id == "hibob_1.0.0_hibob_create_employee_global"
+        assert results[0].id == _BAMBOOHR_ID
+        assert results[1].id == _HIBOB_ID
         # Verify min_similarity was passed to the search call
         mock_search.assert_called_with(
             query="create employee", connector=None, top_k=None, min_similarity=0.5
@@ -446,12 +560,9 @@ class TestSemanticSearchIntegration:
 
     def test_tools_no_longer_has_utility_tools(self) -> None:
         """Test that utility_tools abstraction has been removed from Tools."""
-        from stackone_ai.models import StackOneTool, Tools
-
-        tool = MagicMock(spec=StackOneTool)
+        # Tools only reads .name, so a spec_set Mock avoids introspecting the pydantic model
+        tool = Mock(spec_set=["name"])
         tool.name = "test_tool"
-        tool.description = "Test tool"
-        tool.connector = "test"
         tools = Tools([tool])
 
         assert not hasattr(tools, "utility_tools")
@@ -466,25 +577,14 @@ class TestSearchModes:
         self,
         mock_fetch: MagicMock,
         mock_search: MagicMock,
+        toolset: StackOneToolSet,
     ) -> None:
         """Test search='local' uses BM25+TF-IDF without calling semantic API."""
-        from stackone_ai import StackOneToolSet
-        from stackone_ai.toolset import _McpToolDefinition
-
         mock_fetch.return_value = [
-            _McpToolDefinition(
-                name="bamboohr_create_employee",
-                description="Creates a new employee in BambooHR",
-                input_schema={"type": "object", "properties": {}},
-            ),
-            _McpToolDefinition(
-                name="bamboohr_list_employees",
-                description="Lists all employees in BambooHR",
-                input_schema={"type": "object", "properties": {}},
-            ),
+            _mcp_tool("bamboohr_create_employee", "Creates a new employee in BambooHR"),
+            _mcp_tool("bamboohr_list_employees", "Lists all employees in BambooHR"),
         ]
 
-        toolset = StackOneToolSet(api_key="test-key", search={"method": "auto"})
         tools = toolset.search_tools("create employee", top_k=5, search="local")
 
         assert len(tools) > 0
@@ -496,21 +596,14 @@ class TestSearchModes:
         self,
         mock_fetch: MagicMock,
         mock_search: MagicMock,
+        toolset: StackOneToolSet,
     ) -> None:
         """Test search='semantic' raises SemanticSearchError on failure."""
-        from stackone_ai import StackOneToolSet
-        from stackone_ai.toolset import _McpToolDefinition
-
         mock_search.side_effect = SemanticSearchError("API unavailable")
         mock_fetch.return_value = [
-            _McpToolDefinition(
-                name="bamboohr_create_employee",
-                description="Creates a new employee",
-                input_schema={"type": "object", "properties": {}},
-            ),
+            _mcp_tool("bamboohr_create_employee", "Creates a new employee"),
         ]
 
-        toolset = StackOneToolSet(api_key="test-key", search={"method": "auto"})
         with pytest.raises(SemanticSearchError):
             toolset.search_tools("create employee", search="semantic")
 
@@ -520,21 +613,14 @@ class TestSearchModes:
         self,
         mock_fetch: MagicMock,
         mock_search: MagicMock,
+        toolset: StackOneToolSet,
     ) -> None:
         """Test search='auto' falls back to local on semantic failure."""
-        from stackone_ai import StackOneToolSet
-        from stackone_ai.toolset import _McpToolDefinition
-
         mock_search.side_effect = SemanticSearchError("API unavailable")
         mock_fetch.return_value = [
-            _McpToolDefinition(
-                name="bamboohr_create_employee",
-                description="Creates a new employee in BambooHR",
-                input_schema={"type": "object", "properties": {}},
-            ),
+            _mcp_tool("bamboohr_create_employee", "Creates a new employee in BambooHR"),
         ]
 
-        toolset = StackOneToolSet(api_key="test-key", search={"method": "auto"})
         tools = toolset.search_tools("create employee", top_k=5, search="auto")
 
         assert len(tools) > 0
@@ -545,20 +631,13 @@ class TestSearchModes:
         self,
         mock_fetch: MagicMock,
         mock_search: MagicMock,
+        toolset: StackOneToolSet,
     ) -> None:
         """Test that get_search_tool(search='local') passes mode through."""
-        from stackone_ai import StackOneToolSet
-        from stackone_ai.toolset import _McpToolDefinition
-
         mock_fetch.return_value = [
-            _McpToolDefinition(
-                name="bamboohr_list_employees",
-                description="Lists employees in BambooHR",
-                input_schema={"type": "object", "properties": {}},
-            ),
+            _mcp_tool("bamboohr_list_employees", "Lists employees in BambooHR"),
         ]
 
-        toolset = StackOneToolSet(api_key="test-key", search={"method": "auto"})
         search_tool = toolset.get_search_tool(search="local")
         tools = search_tool("list employees", top_k=5)
 
@@ -569,62 +648,20 @@ class TestSearchModes:
 class TestConnectorProperty:
     """Tests for StackOneTool.connector property."""
 
-    def test_connector_extracts_from_name(self) -> None:
-        """Test that connector is extracted from tool name."""
-        from stackone_ai.models import ExecuteConfig, StackOneTool, ToolParameters
-
-        execute_config = ExecuteConfig(
-            name="bamboohr_create_employee",
-            method="POST",
-            url="https://api.example.com",
-            headers={},
-        )
-        tool = StackOneTool(
-            description="Creates employee",
-            parameters=ToolParameters(type="object", properties={}),
-            _execute_config=execute_config,
-            _api_key="test-key",
-        )
-
-        assert tool.connector == "bamboohr"
-
-    def test_connector_is_lowercase(self) -> None:
-        """Test that connector is always lowercase."""
-        from stackone_ai.models import ExecuteConfig, StackOneTool, ToolParameters
-
-        execute_config = ExecuteConfig(
-            name="BambooHR_Create_Employee",
-            method="POST",
-            url="https://api.example.com",
-            headers={},
-        )
-        tool = StackOneTool(
-            description="Creates employee",
-            parameters=ToolParameters(type="object", properties={}),
-            _execute_config=execute_config,
-            _api_key="test-key",
-        )
-
-        assert tool.connector == "bamboohr"
-
-    def test_connector_with_single_word_name(self) -> None:
-        """Test connector extraction with single-word tool name."""
-        from stackone_ai.models import ExecuteConfig, StackOneTool, ToolParameters
-
-        execute_config = ExecuteConfig(
-            name="utility",
-            method="POST",
-            url="https://api.example.com",
-            headers={},
-        )
-        tool = StackOneTool(
-            description="Utility tool",
-            parameters=ToolParameters(type="object", properties={}),
-            _execute_config=execute_config,
-            _api_key="test-key",
-        )
-
-        assert tool.connector == "utility"
+    @pytest.mark.parametrize(
+        ("name", "expected"),
+        [
+            # Connector is the prefix before the first underscore
+            ("bamboohr_create_employee", "bamboohr"),
+            # Connector is always lowercase
+            ("BambooHR_Create_Employee", "bamboohr"),
+            # Single-word names are their own connector
+            ("utility", "utility"),
+        ],
+    )
+    def test_connector_from_name(self, name: str, expected: str) -> None:
+        """Test that connector is extracted from the tool name."""
+        assert _make_tool(name).connector == expected
 
 
 class TestToolsConnectorHelpers:
@@ -632,22 +669,12 @@ class TestToolsConnectorHelpers:
 
     def test_get_connectors(self) -> None:
         """Test getting unique connectors from tools collection."""
-        from stackone_ai.models import ExecuteConfig, StackOneTool, ToolParameters, Tools
-
-        def make_tool(name: str) -> StackOneTool:
-            return StackOneTool(
-                description=f"Tool {name}",
-                parameters=ToolParameters(type="object", properties={}),
-                _execute_config=ExecuteConfig(name=name, method="POST", url="", headers={}),
-                _api_key="test-key",
-            )
-
         tools = Tools(
             [
-                make_tool("bamboohr_create_employee"),
-                make_tool("bamboohr_list_employees"),
-                make_tool("hibob_create_employee"),
-                make_tool("slack_send_message"),
+                _make_tool("bamboohr_create_employee"),
+                _make_tool("bamboohr_list_employees"),
+                _make_tool("hibob_create_employee"),
+                _make_tool("slack_send_message"),
             ]
         )
 
@@ -657,8 +684,6 @@ class TestToolsConnectorHelpers:
 
     def test_get_connectors_empty(self) -> None:
         """Test get_connectors with empty tools collection."""
-        from stackone_ai.models import Tools
-
         tools = Tools([])
         assert tools.get_connectors() == set()
 
@@ -668,10 +693,10 @@ class TestSearchActionNamesWithAccountIds:
 
     @patch.object(SemanticSearchClient, "search")
     @patch("stackone_ai.toolset._fetch_mcp_tools")
-    def test_filters_by_account_connectors(self, mock_fetch: MagicMock, mock_search: MagicMock) -> None:
+    def test_filters_by_account_connectors(
+        self, mock_fetch: MagicMock, mock_search: MagicMock, toolset: StackOneToolSet
+    ) -> None:
         """Test that only connectors from linked accounts are searched (per-connector parallel)."""
-        from stackone_ai import StackOneToolSet
-        from stackone_ai.toolset import _McpToolDefinition
 
         def _search_side_effect(
             query: str,
@@ -680,10 +705,10 @@ class TestSearchActionNamesWithAccountIds:
             min_similarity: float | None = None,
         ) -> SemanticSearchResponse:
             if connector == "bamboohr":
-                return SemanticSearchResponse(
+                return _response(
                     results=[
-                        SemanticSearchResult(
-                            id="bamboohr_1.0.0_bamboohr_create_employee_global",
+                        _result(
+                            id=_BAMBOOHR_ID,
                             similarity_score=0.95,
                         ),
                     ],
@@ -691,35 +716,26 @@ class TestSearchActionNamesWithAccountIds:
                     query=query,
                 )
             elif connector == "hibob":
-                return SemanticSearchResponse(
+                return _response(
                     results=[
-                        SemanticSearchResult(
-                            id="hibob_1.0.0_hibob_create_employee_global",
+                        _result(
+                            id=_HIBOB_ID,
                             similarity_score=0.85,
                         ),
                     ],
                     total_count=1,
                     query=query,
                 )
-            return SemanticSearchResponse(results=[], total_count=0, query=query)
+            return _response(results=[], total_count=0, query=query)
 
         mock_search.side_effect = _search_side_effect
 
         # Mock MCP to return only bamboohr and hibob tools (user's linked accounts)
         mock_fetch.return_value = [
-            _McpToolDefinition(
-                name="bamboohr_create_employee",
-                description="Creates employee",
-                input_schema={"type": "object", "properties": {}},
-            ),
-            _McpToolDefinition(
-                name="hibob_create_employee",
-                description="Creates employee",
-                input_schema={"type": "object", "properties": {}},
-            ),
+            _mcp_tool("bamboohr_create_employee", "Creates employee"),
+            _mcp_tool("hibob_create_employee", "Creates employee"),
         ]
 
-        toolset = StackOneToolSet(api_key="test-key", search={"method": "auto"})
         results = toolset.search_action_names(
             "create employee",
             account_ids=["acc-123"],
@@ -729,33 +745,45 @@ class TestSearchActionNamesWithAccountIds:
         # Only bamboohr and hibob searched (workday never queried)
         assert len(results) == 2
         action_ids = [r.id for r in results]
-        assert "bamboohr_1.0.0_bamboohr_create_employee_global" in action_ids
-        assert "hibob_1.0.0_hibob_create_employee_global" in action_ids
+        assert _BAMBOOHR_ID in action_ids
+        assert _HIBOB_ID in action_ids
         # Verify only per-connector calls were made (no global call)
         assert mock_search.call_count == 2
         called_connectors = {call.kwargs.get("connector") for call in mock_search.call_args_list}
         assert called_connectors == {"bamboohr", "hibob"}
 
     @patch.object(SemanticSearchClient, "search")
-    def test_search_action_names_returns_empty_on_failure(self, mock_search: MagicMock) -> None:
+    @patch("stackone_ai.toolset._fetch_mcp_tools")
+    def test_empty_connectors_skips_api(
+        self, mock_fetch: MagicMock, mock_search: MagicMock, toolset: StackOneToolSet
+    ) -> None:
+        """Test that accounts with no tools short-circuit before any semantic search call."""
+        mock_fetch.return_value = []
+
+        results = toolset.search_action_names("create employee", account_ids=["acc-123"])
+
+        assert results == []
+        mock_search.assert_not_called()
+
+    @patch.object(SemanticSearchClient, "search")
+    def test_search_action_names_returns_empty_on_failure(
+        self, mock_search: MagicMock, toolset: StackOneToolSet
+    ) -> None:
         """Test that search_action_names returns [] when semantic search fails."""
-        from stackone_ai import StackOneToolSet
 
         mock_search.side_effect = SemanticSearchError("API unavailable")
 
-        toolset = StackOneToolSet(api_key="test-key", search={"method": "auto"})
         results = toolset.search_action_names("create employee")
 
         assert results == []
 
     @patch.object(SemanticSearchClient, "search")
     @patch("stackone_ai.toolset._fetch_mcp_tools")
-    def test_searches_all_connectors_in_parallel(self, mock_fetch: MagicMock, mock_search: MagicMock) -> None:
+    def test_searches_all_connectors_in_parallel(
+        self, mock_fetch: MagicMock, mock_search: MagicMock, toolset: StackOneToolSet
+    ) -> None:
         """Test that all available connectors are searched directly (no global call + fallback)."""
-        from stackone_ai import StackOneToolSet
-        from stackone_ai.toolset import _McpToolDefinition
-
-        mock_search.return_value = SemanticSearchResponse(
+        mock_search.return_value = _response(
             results=[],
             total_count=0,
             query="test",
@@ -763,19 +791,10 @@ class TestSearchActionNamesWithAccountIds:
 
         # Mock MCP to return tools from two connectors
         mock_fetch.return_value = [
-            _McpToolDefinition(
-                name="bamboohr_list_employees",
-                description="Lists employees",
-                input_schema={"type": "object", "properties": {}},
-            ),
-            _McpToolDefinition(
-                name="hibob_list_employees",
-                description="Lists employees",
-                input_schema={"type": "object", "properties": {}},
-            ),
+            _mcp_tool("bamboohr_list_employees", "Lists employees"),
+            _mcp_tool("hibob_list_employees", "Lists employees"),
         ]
 
-        toolset = StackOneToolSet(api_key="test-key", search={"method": "auto"})
         toolset.search_action_names(
             "test",
             account_ids=["acc-123"],
@@ -792,15 +811,14 @@ class TestSearchActionNamesWithAccountIds:
 
     @patch.object(SemanticSearchClient, "search")
     @patch("stackone_ai.toolset._fetch_mcp_tools")
-    def test_respects_top_k_after_filtering(self, mock_fetch: MagicMock, mock_search: MagicMock) -> None:
+    def test_respects_top_k_after_filtering(
+        self, mock_fetch: MagicMock, mock_search: MagicMock, toolset: StackOneToolSet
+    ) -> None:
         """Test that results are limited to top_k after filtering."""
-        from stackone_ai import StackOneToolSet
-        from stackone_ai.toolset import _McpToolDefinition
-
         # Return more results than top_k using composite IDs
-        mock_search.return_value = SemanticSearchResponse(
+        mock_search.return_value = _response(
             results=[
-                SemanticSearchResult(
+                _result(
                     id=f"bamboohr_1.0.0_bamboohr_action_{i}_global",
                     similarity_score=0.9 - i * 0.1,
                 )
@@ -812,14 +830,9 @@ class TestSearchActionNamesWithAccountIds:
 
         # Mock MCP to return bamboohr tools
         mock_fetch.return_value = [
-            _McpToolDefinition(
-                name="bamboohr_action_0",
-                description="Action 0",
-                input_schema={"type": "object", "properties": {}},
-            ),
+            _mcp_tool("bamboohr_action_0", "Action 0"),
         ]
 
-        toolset = StackOneToolSet(api_key="test-key", search={"method": "auto"})
         results = toolset.search_action_names(
             "test",
             account_ids=["acc-123"],
@@ -837,8 +850,6 @@ class TestNormalizeActionName:
 
     def test_versioned_name_is_normalized(self) -> None:
         """Test that versioned API names are normalized to MCP format."""
-        from stackone_ai.utils.normalize import _normalize_action_name
-
         assert (
             _normalize_action_name("calendly_1.0.0_calendly_create_scheduling_link_global")
             == "calendly_create_scheduling_link"
@@ -846,8 +857,6 @@ class TestNormalizeActionName:
 
     def test_multi_segment_version(self) -> None:
         """Test normalization with multi-segment semver."""
-        from stackone_ai.utils.normalize import _normalize_action_name
-
         assert (
             _normalize_action_name("breathehr_1.0.1_breathehr_list_employees_global")
             == "breathehr_list_employees"
@@ -855,26 +864,18 @@ class TestNormalizeActionName:
 
     def test_already_normalized_name_unchanged(self) -> None:
         """Test that MCP-format names pass through unchanged."""
-        from stackone_ai.utils.normalize import _normalize_action_name
-
         assert _normalize_action_name("bamboohr_create_employee") == "bamboohr_create_employee"
 
     def test_non_matching_name_unchanged(self) -> None:
         """Test that names that don't match the pattern pass through unchanged."""
-        from stackone_ai.utils.normalize import _normalize_action_name
-
         assert _normalize_action_name("some_random_tool") == "some_random_tool"
 
     def test_empty_string(self) -> None:
         """Test empty string input."""
-        from stackone_ai.utils.normalize import _normalize_action_name
-
         assert _normalize_action_name("") == ""
 
     def test_multiple_versions_normalize_to_same(self) -> None:
         """Test that different versions of the same action normalize identically."""
-        from stackone_ai.utils.normalize import _normalize_action_name
-
         name_v1 = _normalize_action_name("breathehr_1.0.0_breathehr_list_employees_global")
         name_v2 = _normalize_action_name("breathehr_1.0.1_breathehr_list_employees_global")
         assert name_v1 == name_v2 == "breathehr_list_employees"
@@ -885,23 +886,22 @@ class TestSemanticSearchDeduplication:
 
     @patch.object(SemanticSearchClient, "search")
     @patch("stackone_ai.toolset._fetch_mcp_tools")
-    def test_search_tools_deduplicates_versions(self, mock_fetch: MagicMock, mock_search: MagicMock) -> None:
+    def test_search_tools_deduplicates_versions(
+        self, mock_fetch: MagicMock, mock_search: MagicMock, toolset: StackOneToolSet
+    ) -> None:
         """Test that search_tools deduplicates multiple results with the same normalized action name."""
-        from stackone_ai import StackOneToolSet
-        from stackone_ai.toolset import _McpToolDefinition
-
-        mock_search.return_value = SemanticSearchResponse(
+        mock_search.return_value = _response(
             results=[
-                SemanticSearchResult(
+                _result(
                     id="breathehr_1.0.0_breathehr_list_employees_global",
                     similarity_score=0.95,
                 ),
-                SemanticSearchResult(
+                _result(
                     id="breathehr_1.0.1_breathehr_list_employees_global",
                     similarity_score=0.90,
                 ),
-                SemanticSearchResult(
-                    id="bamboohr_1.0.0_bamboohr_create_employee_global",
+                _result(
+                    id=_BAMBOOHR_ID,
                     similarity_score=0.85,
                 ),
             ],
@@ -910,19 +910,10 @@ class TestSemanticSearchDeduplication:
         )
 
         mock_fetch.return_value = [
-            _McpToolDefinition(
-                name="breathehr_list_employees",
-                description="Lists employees",
-                input_schema={"type": "object", "properties": {}},
-            ),
-            _McpToolDefinition(
-                name="bamboohr_create_employee",
-                description="Creates employee",
-                input_schema={"type": "object", "properties": {}},
-            ),
+            _mcp_tool("breathehr_list_employees", "Lists employees"),
+            _mcp_tool("bamboohr_create_employee", "Creates employee"),
         ]
 
-        toolset = StackOneToolSet(api_key="test-key", search={"method": "auto"})
         tools = toolset.search_tools("list employees", top_k=5)
 
         # Should deduplicate: both breathehr entries normalize to breathehr_list_employees
@@ -932,17 +923,18 @@ class TestSemanticSearchDeduplication:
         assert len(tools) == 2
 
     @patch.object(SemanticSearchClient, "search")
-    def test_search_action_names_with_duplicates(self, mock_search: MagicMock) -> None:
+    def test_search_action_names_with_duplicates(
+        self, mock_search: MagicMock, toolset: StackOneToolSet
+    ) -> None:
         """Test that search_action_names handles duplicate action_ids from different versions."""
-        from stackone_ai import StackOneToolSet
 
-        mock_search.return_value = SemanticSearchResponse(
+        mock_search.return_value = _response(
             results=[
-                SemanticSearchResult(
+                _result(
                     id="breathehr_1.0.0_breathehr_list_employees_global",
                     similarity_score=0.95,
                 ),
-                SemanticSearchResult(
+                _result(
                     id="breathehr_1.0.1_breathehr_list_employees_global",
                     similarity_score=0.90,
                 ),
@@ -951,7 +943,6 @@ class TestSemanticSearchDeduplication:
             query="list employees",
         )
 
-        toolset = StackOneToolSet(api_key="test-key", search={"method": "auto"})
         results = toolset.search_action_names("list employees", top_k=5)
 
         # Both results are returned (dedup may or may not happen depending on implementation)
@@ -970,15 +961,13 @@ class TestZeroMatchFallback:
         self,
         mock_fetch: MagicMock,
         mock_search: MagicMock,
+        toolset: StackOneToolSet,
     ) -> None:
         """Auto mode falls back to local search when semantic results don't match any MCP tools."""
-        from stackone_ai import StackOneToolSet
-        from stackone_ai.toolset import _McpToolDefinition
-
         # Semantic returns results with IDs that won't match MCP tool names
-        mock_search.return_value = SemanticSearchResponse(
+        mock_search.return_value = _response(
             results=[
-                SemanticSearchResult(
+                _result(
                     id="unknown_1.0.0_nonexistent_action_global",
                     similarity_score=0.95,
                 ),
@@ -988,14 +977,9 @@ class TestZeroMatchFallback:
         )
 
         mock_fetch.return_value = [
-            _McpToolDefinition(
-                name="bamboohr_create_employee",
-                description="Creates a new employee in BambooHR",
-                input_schema={"type": "object", "properties": {}},
-            ),
+            _mcp_tool("bamboohr_create_employee", "Creates a new employee in BambooHR"),
         ]
 
-        toolset = StackOneToolSet(api_key="test-key", search={"method": "auto"})
         tools = toolset.search_tools("manage employees", top_k=5)
 
         # Should fall back to local search and return results (not empty)
@@ -1007,15 +991,13 @@ class TestZeroMatchFallback:
         self,
         mock_fetch: MagicMock,
         mock_search: MagicMock,
+        toolset: StackOneToolSet,
     ) -> None:
         """Semantic mode returns empty results when no tools match, does not fall back."""
-        from stackone_ai import StackOneToolSet
-        from stackone_ai.toolset import _McpToolDefinition
-
         # Semantic returns results with IDs that won't match MCP tool names
-        mock_search.return_value = SemanticSearchResponse(
+        mock_search.return_value = _response(
             results=[
-                SemanticSearchResult(
+                _result(
                     id="unknown_1.0.0_nonexistent_action_global",
                     similarity_score=0.95,
                 ),
@@ -1025,14 +1007,9 @@ class TestZeroMatchFallback:
         )
 
         mock_fetch.return_value = [
-            _McpToolDefinition(
-                name="bamboohr_create_employee",
-                description="Creates a new employee in BambooHR",
-                input_schema={"type": "object", "properties": {}},
-            ),
+            _mcp_tool("bamboohr_create_employee", "Creates a new employee in BambooHR"),
         ]
 
-        toolset = StackOneToolSet(api_key="test-key", search={"method": "auto"})
         tools = toolset.search_tools("manage employees", search="semantic", top_k=5)
 
         # Semantic mode should return empty, not fall back
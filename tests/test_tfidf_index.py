@@ -1,5 +1,6 @@
 """Tests for TF-IDF index implementation"""
 
+import math
 import string
 
 import pytest
@@ -408,6 +409,37 @@ class TestTfidfIndex:
         if common_id is not None and rare_id is not None:
             assert index.idf[rare_id] > index.idf[common_id]
 
+    def test_postings_match_document_norms(self, sample_documents):
+        """Test each document's norm is the length of its weights in the inverted index"""
+        index = TfidfIndex()
+        index.build(sample_documents)
+
+        norm_sq = [0.0] * len(index.docs)
+        for postings in index.postings.values():
+            for doc_index, weight in postings:
+                assert weight > 0
+                norm_sq[doc_index] += weight * weight
+
+        for doc, total in zip(index.docs, norm_sq, strict=True):
+            assert doc["norm"] == pytest.approx(math.sqrt(total) if total > 0 else 1.0)
+
+    def test_docs_expose_sparse_vectors(self, sample_documents):
+        """Test docs keep their id, vec and norm keys, with vec rebuilt from the postings"""
+        index = TfidfIndex()
+        index.build(sample_documents)
+
+        docs = index.docs
+        assert [doc["id"] for doc in docs] == [doc.id for doc in sample_documents]
+        for term_id, postings in index.postings.items():
+            for doc_index, weight in postings:
+                vec = docs[doc_index]["vec"]
+                assert isinstance(vec, dict)
+                assert vec[term_id] == weight
+        for doc in docs:
+            vec = doc["vec"]
+            assert isinstance(vec, dict)
+            assert doc["norm"] == pytest.approx(math.sqrt(sum(w * w for w in vec.values())) or 1.0)
+
 
 class TestTfidfDocument:
     """Test TfidfDocument named tuple"""
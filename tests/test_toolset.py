@@ -18,6 +18,8 @@ from stackone_ai.toolset import (
     ToolsetError,
     ToolsetLoadError,
     _build_auth_header,
+    _compile_globs,
+    _provider_set,
     _run_async,
 )
 
@@ -294,15 +296,15 @@ def test_filter_by_provider():
     toolset = StackOneToolSet(api_key="test_key")
 
     # Test matching providers
-    assert toolset._filter_by_provider("hibob_list_employees", ["hibob", "bamboohr"])
-    assert toolset._filter_by_provider("bamboohr_create_job", ["hibob", "bamboohr"])
+    assert toolset._filter_by_provider("hibob_list_employees", _provider_set(["hibob", "bamboohr"]))
+    assert toolset._filter_by_provider("bamboohr_create_job", _provider_set(["hibob", "bamboohr"]))
 
     # Test non-matching providers
-    assert not toolset._filter_by_provider("workday_list_contacts", ["hibob", "bamboohr"])
+    assert not toolset._filter_by_provider("workday_list_contacts", _provider_set(["hibob", "bamboohr"]))
 
     # Test case-insensitive matching
-    assert toolset._filter_by_provider("HIBOB_list_employees", ["hibob"])
-    assert toolset._filter_by_provider("hibob_list_employees", ["HIBOB"])
+    assert toolset._filter_by_provider("HIBOB_list_employees", _provider_set(["hibob"]))
+    assert toolset._filter_by_provider("hibob_list_employees", _provider_set(["HIBOB"]))
 
 
 def test_filter_by_action():
@@ -310,17 +312,20 @@ def test_filter_by_action():
     toolset = StackOneToolSet(api_key="test_key")
 
     # Test exact match
-    assert toolset._filter_by_action("hibob_list_employees", ["hibob_list_employees"])
+    assert toolset._filter_by_action("hibob_list_employees", _compile_globs(("hibob_list_employees",)))
 
     # Test glob pattern
-    assert toolset._filter_by_action("hibob_list_employees", ["*_list_employees"])
-    assert toolset._filter_by_action("bamboohr_list_employees", ["*_list_employees"])
-    assert toolset._filter_by_action("hibob_list_employees", ["hibob_*"])
-    assert toolset._filter_by_action("hibob_create_employee", ["hibob_*"])
+    assert toolset._filter_by_action("hibob_list_employees", _compile_globs(("*_list_employees",)))
+    assert toolset._filter_by_action("bamboohr_list_employees", _compile_globs(("*_list_employees",)))
+    assert toolset._filter_by_action("hibob_list_employees", _compile_globs(("hibob_*",)))
+    assert toolset._filter_by_action("hibob_create_employee", _compile_globs(("hibob_*",)))
 
     # Test non-matching patterns
-    assert not toolset._filter_by_action("workday_list_contacts", ["*_list_employees"])
-    assert not toolset._filter_by_action("bamboohr_create_job", ["hibob_*"])
+    assert not toolset._filter_by_action("workday_list_contacts", _compile_globs(("*_list_employees",)))
+    assert not toolset._filter_by_action("bamboohr_create_job", _compile_globs(("hibob_*",)))
+
+    # Test empty pattern set matches nothing
+    assert not toolset._filter_by_action("hibob_list_employees", _compile_globs(()))
 
 
 @given(
@@ -332,12 +337,27 @@ def test_filter_by_action_matches_fnmatch_pbt(tool_name: str, pattern: str):
     """PBT: Test that action filtering matches Python fnmatch behavior."""
     toolset = StackOneToolSet(api_key="test_key")
 
-    result = toolset._filter_by_action(tool_name, [pattern])
+    result = toolset._filter_by_action(tool_name, _compile_globs((pattern,)))
     expected = fnmatch.fnmatch(tool_name, pattern)
 
     assert result == expected, f"Mismatch for tool='{tool_name}', pattern='{pattern}'"
 
 
+@given(
+    tool_name=tool_name_strategy,
+    patterns=st.lists(glob_pattern_strategy, min_size=1, max_size=5),
+)
+@settings(max_examples=100)
+def test_filter_by_action_multiple_patterns_pbt(tool_name: str, patterns: list[str]):
+    """PBT: Test that the combined pattern regex matches when any single pattern does."""
+    toolset = StackOneToolSet(api_key="test_key")
+
+    result = toolset._filter_by_action(tool_name, _compile_globs(tuple(patterns)))
+    expected = any(fnmatch.fnmatch(tool_name, pattern) for pattern in patterns)
+
+    assert result == expected, f"Mismatch for tool='{tool_name}', patterns={patterns}"
+
+
 @given(
     provider=provider_name_strategy,
     action=st.text(alphabet=string.ascii_lowercase + "_", min_size=1, max_size=20),
@@ -350,7 +370,7 @@ def test_filter_by_provider_case_insensitive_pbt(provider: str, action: str, ent
     tool_name = f"{provider}_{action}_{entity}"
 
     # Should match regardless of case
-    assert toolset._filter_by_provider(tool_name, [provider.lower()])
-    assert toolset._filter_by_provider(tool_name, [provider.upper()])
-    assert toolset._filter_by_provider(tool_name.upper(), [provider.lower()])
-    assert toolset._filter_by_provider(tool_name.lower(), [provider.upper()])
+    assert toolset._filter_by_provider(tool_name, _provider_set([provider.lower()]))
+    assert toolset._filter_by_provider(tool_name, _provider_set([provider.upper()]))
+    assert toolset._filter_by_provider(tool_name.upper(), _provider_set([provider.lower()]))
+    assert toolset._filter_by_provider(tool_name.lower(), _provider_set([provider.upper()]))